@@ -232,6 +232,25 @@ Attributes:
         and discharging, this is the frequency (in milliseconds) with which to
         emit telemetry updates.
 
+    TELEMETRY_BAT_V_DELTA: In the battery ID state (after dis/charge) the
+        battery voltage takes time to stabilize. We only emit telemetry for a
+        battery voltage change in this state if it changed by at least this
+        many millivolts since the last emit.
+
+    TELEMETRY_DELTA_FULL: If 0 (default), every BC telemetry message is a full
+        snapshot of the BC state. If greater than 0, messages for a BC whose
+        state did not change only contain the values that changed since the
+        previous message, and are published on a ``delta`` sub topic of the
+        BC topic. A full snapshot is still published on every state change,
+        and after this many delta messages.
+
+    TELEMETRY_COMBINED: If ``False`` (default), telemetry for each BC is
+        published on it's own topic. If ``True``, the full messages for all
+        BCs that need telemetry emitted at the same time, are combined into a
+        single message keyed on BC name, and published on the ``all`` sub
+        topic of ``net_conf.MQTT_PUB_TOPIC``. `TELEMETRY_DELTA_FULL` is ignored
+        in this case.
+
     SOC_REST_TIME: The amount of time to rest after a charge or discharge
         complete to allow the battery and/or load temperatures to stabilize.
 
@@ -366,6 +385,14 @@ D_RECOVER_MIN_TM = 3 * 60
 # For continues telemetry emission states like charging and discharging, this is
 # the frequency (in milliseconds) with which to emit telemetry updates.
 TELEMETRY_EMIT_FREQ = 5000
+# Minimum battery voltage change (mV) while in the battery ID state for which
+# to emit telemetry updates.
+TELEMETRY_BAT_V_DELTA = 5
+# Publish only changed values on the delta sub topic, with a full message on
+# state changes and after this many deltas. 0 to always publish full messages.
+TELEMETRY_DELTA_FULL = 0
+# Publish all BC messages due at the same time in one combined message.
+TELEMETRY_COMBINED = False
 
 ##### SoC Measurement config ####
 # The amount of time to rest after a charge or discharge complete to allow the
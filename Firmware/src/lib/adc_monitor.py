@@ -375,30 +375,35 @@ class ADCMonitor:
             Updates `_spike_buf` if spike detection is enabled.
         """
         # We ignore this if spike detection is disabled.
-        if self._spike is None:
+        spike = self._spike
+        if spike is None:
             return
 
+        # Local references since we are called for every sample
+        buf = self._spike_buf
+        val = self._spike_val
+
         # Is our buffer full?
-        if len(self._spike_buf) < self._spike_buf_len:
-            self._spike_buf.append(self._spike_val)
+        if len(buf) < self._spike_buf_len:
+            buf.append(val)
             return
 
         # Shift the buffer left, keeping the old value and push the new one
-        oldest = self._spike_buf.pop(0)
-        self._spike_buf.append(self._spike_val)
+        oldest = buf.pop(0)
+        buf.append(val)
 
-        delta = self._spike_val - oldest
-        if abs(delta) >= self._spike.threshold:
+        delta = val - oldest
+        if abs(delta) >= spike.threshold:
             # Spike detected...
             # Reset the buffer so we do not double detect
             self._spike_buf = []
             try:
                 # Do the callback, passing the jump arg if the spike is
                 # positive, or else the drop arg if negative.
-                self._spike.callback(
-                    self._spike.drop_arg if delta < 0 else self._spike.jump_arg,
+                spike.callback(
+                    spike.drop_arg if delta < 0 else spike.jump_arg,
                     oldest,
-                    self._spike_val,
+                    val,
                 )
             except Exception as exc:
                 logger.error(
@@ -448,6 +453,16 @@ class ADCMonitor:
         # average over a 20 window sample.
         adc_tm_alpha = 1 / 20
 
+        # Local references for anything used on every sample that does not
+        # change while we run. Local lookups are much faster than global or
+        # attribute lookups in MicroPython.
+        ticks_ms = time.ticks_ms
+        ticks_diff = time.ticks_diff
+        adc = self._adc
+        addr = self._chan.addr
+        channel = self._chan.chan
+        rate = self.ADC_RATE
+
         # Just keep looping....
         while not self._disabled:
             # First we delay...
@@ -468,32 +483,28 @@ class ADCMonitor:
 
             # Update sample interval timer. On the first time around we will
             # not have a start time, so need to set that first.
+            # Timer for the sample timer, also used as current time for the
+            # interval timer.
+            loop_timer = ticks_ms()
+
             if sample_interval_timer is not None:
-                self._tm_sample_interval = time.ticks_diff(
-                    time.ticks_ms(), sample_interval_timer
-                )
+                self._tm_sample_interval = ticks_diff(loop_timer, sample_interval_timer)
             # Update the interval timer to now.
-            sample_interval_timer = time.ticks_ms()
-
-            # Timer for the sample timer
-            loop_timer = time.ticks_ms()
+            sample_interval_timer = loop_timer
 
             # Set up the ADS1115 instance with the address for our monitor.
             # Remember that there may be multiple monitors using the same self._adc
             # instance we use, and every time these monitors runs, they will change
             # the address for the self._adc (self._adc is shared amongst them all).
-            self._adc.address = self._chan.addr
+            adc.address = addr
 
             # Read the channel ADC value, converted as mV value
-            val = self._adc.raw_to_v(
-                self._adc.read(rate=self.ADC_RATE, channel1=self._chan.chan),
-                mV=True,
-            )
+            val = adc.raw_to_v(adc.read(rate=rate, channel1=channel), mV=True)
 
             # Update the ADC read timer average
             self._tm_adc_sample = ewAverage(
                 adc_tm_alpha,
-                time.ticks_diff(time.ticks_ms(), loop_timer),
+                ticks_diff(ticks_ms(), loop_timer),
                 self._tm_adc_sample,
             )
 
@@ -522,7 +533,7 @@ class ADCMonitor:
             # for the ADC sample timer.
             self._tm_mon_loop = ewAverage(
                 adc_tm_alpha,
-                time.ticks_diff(time.ticks_ms(), loop_timer),
+                ticks_diff(ticks_ms(), loop_timer),
                 self._tm_mon_loop,
             )
 
@@ -947,23 +958,24 @@ class ChargeMonitor(CurrentMonitor):
 
     On every ADC read, the `_interpret()` function will convert the base
     `CurrentMonitor._current` to Charge as explained above, and accumulate this
-    as the total Charge in the `_charge` property.
+    as the total Charge in `_charge_uc`.
 
-    The `_charge` value will be in millicoulomb as the
-    `CurrentMonitor._current` is in milliamps.
+    Since `CurrentMonitor._current` is in milliamps and the sample interval in
+    milliseconds, the Charge for each sample is in microcoulomb. We accumulate
+    this as an integer, which avoids the precision loss of repeatedly adding
+    small values to a large single precision float total (MicroPython floats
+    are single precision on the ESP32) over a long charge cycle.
 
-    In addition to `_charge` in Coulomb_, the Amp-Hour Charge value will also be
-    calculated in the `_mAh` property. This is also in millis, since everything
-    else is in millis.
+    The Charge in millicoulomb (`charge`) and the Amp-Hour Charge value in
+    milliamp-hour (`mAh`) are only calculated from `_charge_uc` when read.
 
     Attributes:
-        _charge: Calculated Charge in millicoulomb (mC).
-        _mAh: The total Charge in milliamp-hour (mAh).
+        _charge_uc: Accumulated Charge in microcoulomb (µC) as an integer.
         charge_time: The total charge time used to get to this charge state.
             Will be set to 0 on `reset()`
 
-        charge: A property to return the `_charge` as a rounded integer
-        mAh: A property to return the `_mAh` as a rounded integer
+        charge: A property to return the Charge in mC as a rounded integer
+        mAh: A property to return the Charge in mAh as a rounded integer
 
     .. _Coulomb: https://en.wikipedia.org/wiki/Coulomb
     """
@@ -990,8 +1002,7 @@ class ChargeMonitor(CurrentMonitor):
         # Call up..
         super().__init__(ads1115, chan, rate, shunt, avg_w, spike_cfg)
 
-        self._charge: float = 0.0
-        self._mAh: float = 0.0  # It's OK @pylint: disable=invalid-name
+        self._charge_uc: int = 0
         self.charge_time: int = 0
 
     def _interpret(self):
@@ -1005,41 +1016,39 @@ class ChargeMonitor(CurrentMonitor):
             or mAh value.
 
         Side Effect:
-            Sets `charge` and `mAh` to the current total charge in mC and mAh
-            respectively.
+            Adds the charge for this sample to `_charge_uc`, which updates
+            `charge` and `mAh`.
         """
         # Call up
         super()._interpret()
 
         # On the first round, our _tm_sample_interval will be 0, so we can not
         # calculate the charge yet
-        if self._tm_sample_interval == 0:
+        interval = self._tm_sample_interval
+        if interval == 0:
             return
 
         # We calculate the portion of a Coulomb measured using the
         # _tm_sample_interval and the instantaneous current value, and
-        # accumulate this in the `charge` property
-        self._charge += (self._tm_sample_interval * self._current) / 1000
-
-        # And from here we do the mAh
-        self._mAh = self._charge / 3600
+        # accumulate this in microcoulomb (mA x ms)
+        self._charge_uc += round(interval * self._current)
 
         # Update the accumulated charge time
-        self.charge_time += self._tm_sample_interval
+        self.charge_time += interval
 
     @property
     def charge(self):
         """
-        Property to return `_charge` as a rounded integer.
+        Property to return the accumulated Charge in mC as a rounded integer.
         """
-        return round(self._charge)
+        return round(self._charge_uc / 1000)
 
     @property
     def mAh(self):  # It's OK @pylint: disable=invalid-name
         """
-        Property to return `_mAh` as a rounded integer.
+        Property to return the accumulated Charge in mAh as a rounded integer.
         """
-        return round(self._mAh)
+        return round(self._charge_uc / 3_600_000)
 
     def _logDebug(self):
         """
@@ -1076,7 +1085,7 @@ class ChargeMonitor(CurrentMonitor):
 
         logger.info("%s: Resetting monitor...", self._me)
         # Reset
-        self._charge = self._mAh = 0.0
+        self._charge_uc = 0
         self.charge_time = 0
 
         return True
@@ -28,9 +28,10 @@ from lib.adc_monitor import VoltageMonitor, ChargeMonitor
 from lib.statemachines import (  # pylint: disable=unused-import
     BCStateMachine,
     SoCStateMachine,
-    # We do not use this import here, but we import it as a convenience for the
-    # telemetry module that will use it.
+    # We do not use these imports here, but we import it as a convenience for
+    # the telemetry module that will use it.
     telemetry_trigger,
+    telemetry_event,
 )
 from lib.utils import genBatteryID
 
@@ -110,6 +111,9 @@ class BatteryController(BCStateMachine):
             charging.
         _dch_mon: A `ChargeMonitor` as described above to monitor battery
             discharging.
+        _mon_for_state: Maps each charging and discharging related state to
+            either `_ch_mon` or `_dch_mon` as the monitor holding the details
+            for that state. Any other state is not in this map.
     """
 
     # Do not worry @pylint: disable=too-many-instance-attributes
@@ -205,6 +209,13 @@ class BatteryController(BCStateMachine):
                 D_SPIKE_TH, D_SPIKE_TH_T, self._dischargeSpike, False, True
             ),
         )
+        # Which monitor holds the details for the charge/discharge states
+        self._mon_for_state: dict = {
+            self.S_CHARGE: self._ch_mon,
+            self.S_DISCHARGE: self._dch_mon,
+            self.S_CHARGED: self._ch_mon,
+            self.S_DISCHARGED: self._dch_mon,
+        }
         # Determine if the controller will be disable or not, depending if any of
         # the monitors are disabled.
         if any(m._disabled for m in (self._v_mon, self._ch_mon, self._dch_mon)):
@@ -267,7 +278,7 @@ class BatteryController(BCStateMachine):
             self._ch_mon.current,
             self._ch_mon.charge,
             self._ch_mon.mAh,
-            round(self._ch_mon.charge_time / 1000),
+            (self._ch_mon.charge_time + 500) // 1000,
         )
 
     @property
@@ -292,7 +303,7 @@ class BatteryController(BCStateMachine):
             self._dch_mon.current,
             self._dch_mon.charge,
             self._dch_mon.mAh,
-            round(self._dch_mon.charge_time / 1000),
+            (self._dch_mon.charge_time + 500) // 1000,
         )
 
     def transition(self, event: int) -> bool:
@@ -609,7 +620,7 @@ class BatteryController(BCStateMachine):
         for mon in (self._v_mon, self._ch_mon, self._dch_mon):
             mon.reset()
 
-    def setID(self, bat_id: str | None = None) -> bool:
+    def setID(self, bat_id: str | bytes | bytearray | None = None) -> bool:
         """
         Sets the battery ID.
 
@@ -624,12 +635,24 @@ class BatteryController(BCStateMachine):
 
         Args:
             bat_id: None to accept the current ID, or else a max 10 character
-                string as the new ID.
+                string as the new ID. This may also be ASCII ``bytes`` or a
+                ``bytearray``, like a `FieldEdit` value, which will be decoded
+                to a string here.
 
         Returns:
             True if the new ID was set and the transition to the next state was
             successful, False with an error logged otherwise.
         """
+        if isinstance(bat_id, (bytes, bytearray)):
+            # Decode it to a string to be validated below
+            try:
+                bat_id = bat_id.decode("ascii")
+            except UnicodeError:
+                logger.error(
+                    "%s: Bat ID must be ASCII for setID(): %s", self._bc_prefix, bat_id
+                )
+                return False
+
         if not (bat_id is None or isinstance(bat_id, str)):
             logger.error("%s: Invalid bat ID to setID(): %s", self._bc_prefix, bat_id)
             return False
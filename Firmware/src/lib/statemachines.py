@@ -20,6 +20,15 @@ Attributes:
         emit the current state as telemetry data for that BC, and remove the BC
         from the list.
 
+    telemetry_event: An ``asyncio.Event`` that is set whenever something
+        happened that may need telemetry to be emitted, like a
+        `BCStateMachine` state transition or a BC being added to
+        `telemetry_trigger`.
+
+        The `telemetry.broadcast` task waits on this event (with a timeout for
+        periodic updates) instead of continuously polling for changes, and
+        clears it again when it wakes up.
+
 .. _`Finite State Machines`: https://en.wikipedia.org/wiki/Finite-state_machine
 .. _SoC: https://www.batterydesign.net/battery-management-system/state-of-charge
 """
@@ -43,6 +52,8 @@ logger = getLogger(__name__)
 # This is a very simple signaling method to let the Telemetry task know it
 # needs to emit the telemetry for a specific BC.
 telemetry_trigger = []
+# Wakes up the Telemetry task when any state changed or a trigger was added.
+telemetry_event = asyncio.Event()
 
 
 class BCStateMachine:
@@ -345,6 +356,8 @@ class BCStateMachine:
                 self.state_name,
                 self.state,
             )
+            # Let the telemetry task know about the change
+            telemetry_event.set()
             return True
 
         logger.error(
@@ -915,6 +928,7 @@ class SoCStateMachine:
         # for this BC. We do this by signaling it through the telemetry_trigger
         # list.
         telemetry_trigger.append(self._bc)
+        telemetry_event.set()
         # We give the Telemetry emitter 20 * 100ms to emit the telemetry data
         for _ in range(20):
             # To waste as little time as possible, we check the trigger every
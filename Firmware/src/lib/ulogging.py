@@ -40,16 +40,17 @@ Attributes:
 
     _level_dict: Mapping of log level constants to strings.
     _stream: The file type object to write log messages to.
-    telemetry_logs: A FIFO list for log messages to be emitted as telemetry
-        logs.
+    telemetry_logs: A FIFO ``deque`` for log messages to be emitted as
+        telemetry logs.
 
         This FIFO will be monitored by `telemetry.broadcast` for any new
         entries and if found, will publish them as telemetry logs, and then
-        remove them from this list.
+        remove them from this FIFO.
 
         To prevent runaway memory usage in case the telemetry logger is offline
-        or have any issues, `Logger.telemetry_log` will keep this list to not
-        grow beyond 20 messages, removing older messages if needed.
+        or have any issues, this FIFO has a max length of `_TELEM_LOGS_MAX`
+        messages. Once full, the oldest message is dropped for every new one
+        added.
     _level: The global log level. Can be changed via `basicConfig`
     _loggers: Cached name `Logger` instances.
 
@@ -63,6 +64,7 @@ Attributes:
 # pylint: disable=invalid-name
 
 import sys as usys
+from collections import deque
 
 try:
     from config import LOGGING_CFG
@@ -88,7 +90,9 @@ _stream = usys.stderr
 
 # Used for publishing log messages as telemetry log
 # Each entry will be a tuple as: (level, msg)
-telemetry_logs = []
+# The deque drops the oldest entry when appending to a full FIFO.
+_TELEM_LOGS_MAX = 20
+telemetry_logs = deque((), _TELEM_LOGS_MAX)
 
 _level = INFO
 _loggers = {}
@@ -150,14 +154,10 @@ class Logger:
 
         .. note::
             To protect against `telemetry_logs` growing uncontrollably if the
-            network is down for example, we will remove the oldest message
-            where if the log is longer than 20 messages.
+            network is down for example, it has a max length and will drop
+            the oldest message when full.
         """
         if self.isEnabledFor(level, "telem"):
-            # Protect against runaway logs
-            if len(telemetry_logs) >= 20:
-                telemetry_logs.pop(0)
-
             log_msg = ""
             if self.name_out:
                 log_msg = f"{self.name_out}: "
@@ -52,6 +52,15 @@ Attributes:
 
     MQTT_LOG_TOPIC: This is the topic to subscribe to for all log messages
         published by `telemetry.broadcast`.
+
+    MQTT_PUB_QOS: The QoS level for all published messages. Defaults to 0
+        which is fire-and-forget and the fastest option. QoS 1 waits for a
+        broker acknowledgement per message, which considerably slows down
+        publishing, so is only used if `MQTT_ALLOW_QOS1` is also True.
+
+    MQTT_ALLOW_QOS1: Must be set True to allow `MQTT_PUB_QOS` to be anything
+        other than 0. This is a guard against accidentally slowing down
+        publishing.
 """
 
 from sitelocal_conf import overrideLocal
@@ -66,6 +75,8 @@ MQTT_PORT: int = 1883
 MQTT_PUB_TOPIC: str = "BCM/state"
 MQTT_LOG_TOPIC: str = "BCM/log"
 MQTT_CTL_TOPIC: str = "BCM/ctl"
+MQTT_PUB_QOS: int = 0
+MQTT_ALLOW_QOS1: bool = False
 
 # Override any site local values
 overrideLocal(__name__, locals())
@@ -37,7 +37,6 @@ Attributes:
 .. _NTP: https://en.wikipedia.org/wiki/Network_Time_Protocol
 """
 
-import ntptime
 import uasyncio as asyncio
 import network
 from lib.ulogging import getLogger
@@ -184,6 +183,10 @@ def syncTime():
         logger.info("  No internet connection. Cannot set date/time.")
 
     try:
+        # Only imported here since it is only needed for the occasional time
+        # sync. @pylint: disable=import-outside-toplevel
+        import ntptime
+
         # We use the default `pool.ntp.org` time servers for the time.
         ntptime.settime()
         TIME_SYNCED = True
@@ -45,6 +45,7 @@ Attributes:
 # @pylint: disable=too-many-lines
 
 import gc
+import utime as time
 from micropython import const
 from machine import Pin
 from ssd1306 import SSD1306_I2C
@@ -85,6 +86,129 @@ Q1 = const(0b0001)
 Q2 = const(0b0010)
 Q3 = const(0b0100)
 Q4 = const(0b1000)
+# Commonly used quadrant combinations for drawing the logo
+_LOGO_RIGHT = const(Q1 | Q4)  # Right half
+_LOGO_LEFT = const(Q2 | Q3)  # Left half
+_LOGO_FULL = const(Q1 | Q2 | Q3 | Q4)  # Full ellipse
+
+# Config modules that may be updated by updateConfig, keyed by module name
+_CONF_MODULES = {
+    "config": config,
+    "net_conf": net_conf,
+}
+
+# Sentinel for detecting missing attributes with getattr() without having to
+# use hasattr() and then getattr() again.
+_MISSING = object()
+
+# Module level aliases for the BatteryController states we use often. This
+# saves the class attribute lookup on every access.
+_S_GET_ID = BatteryController.S_GET_ID
+_S_BAT_ID = BatteryController.S_BAT_ID
+_S_CHARGE = BatteryController.S_CHARGE
+_S_DISCHARGE = BatteryController.S_DISCHARGE
+_S_CHARGE_PAUSE = BatteryController.S_CHARGE_PAUSE
+_S_DISCHARGE_PAUSE = BatteryController.S_DISCHARGE_PAUSE
+_S_CHARGED = BatteryController.S_CHARGED
+_S_DISCHARGED = BatteryController.S_DISCHARGED
+_S_YANKED = BatteryController.S_YANKED
+
+# BC states in which the battery is being charged, including paused. This is a
+# tuple rather than a set since MicroPython tuple membership for a handful of
+# small ints is as fast as a set lookup, without the extra heap use.
+_CHARGE_STATES = (_S_CHARGE, _S_CHARGE_PAUSE)
+
+# Footer menu option strings that are compared against in the footer menu
+# callbacks. The footer menu definitions are built from these same objects, and
+# in MicroPython these are interned, so the equality tests are cheap.
+# NOTE: Always compare with ==, not `is`, since identity of equal strings is not
+#       guaranteed.
+_MENU_NEXT = ">"
+_MENU_PREV = "<"
+_MENU_EXIT = "Exit"
+_MENU_RET = "Ret"
+_MENU_SOC = "SoC"
+_MENU_CANCEL = "Cancel"
+_MENU_CH = "Ch"
+_MENU_DCH = "Dch"
+_MENU_PAUSE = "Pause"
+_MENU_CONT = "Cont"
+_MENU_STOP = "Stop"
+_MENU_RESET = "Reset"
+
+# Static BCMView footer menu definitions. See FootMenu for the format.
+# S_BAT_ID state
+_FM_BAT_ID = (
+    (_MENU_NEXT, "Next BC"),
+    (_MENU_SOC, "Measure SoC"),
+    (_MENU_CH, "Start Charge"),
+    (_MENU_DCH, "Start Discharge"),
+    (_MENU_RET, "Exit Screen"),
+)
+# Any charge/discharge state while a SoC measurement is in progress
+_FM_SOC_RUNNING = (
+    (_MENU_NEXT, "Next BC"),
+    (_MENU_EXIT, "Exit Screen"),
+    (_MENU_CANCEL, "SoC Measure"),
+)
+# Charge/discharge states for a normal (non SoC) charge or discharge, indexed
+# by the BC state.
+_FM_CH_DCH = {
+    _S_CHARGE: (
+        (_MENU_NEXT, "Next BC"),
+        (_MENU_EXIT, "Exit Screen"),
+        (_MENU_PAUSE, "Pause Charge"),
+    ),
+    _S_DISCHARGE: (
+        (_MENU_NEXT, "Next BC"),
+        (_MENU_EXIT, "Exit Screen"),
+        (_MENU_PAUSE, "Pause Discharge"),
+    ),
+    _S_CHARGE_PAUSE: (
+        (_MENU_NEXT, "Next BC"),
+        (_MENU_EXIT, "Exit Screen"),
+        (_MENU_CONT, "Resume Charge"),
+        (_MENU_STOP, "Stop Charging"),
+    ),
+    _S_DISCHARGE_PAUSE: (
+        (_MENU_NEXT, "Next BC"),
+        (_MENU_EXIT, "Exit Screen"),
+        (_MENU_CONT, "Resume Discharge"),
+        (_MENU_STOP, "Stop Discharging"),
+    ),
+}
+# Charged/discharged states
+_FM_COMPLETE = (
+    (_MENU_NEXT, "Next BC"),
+    (_MENU_EXIT, "Exit Screen"),
+    (_MENU_RESET, "Reset Metrics"),
+)
+# S_YANKED state
+_FM_YANKED = (
+    (_MENU_RESET, "Reset Controller"),
+    (_MENU_EXIT, "Exit Screen"),
+)
+
+# The shunt adjust step for Calibration._adjustShunt. A zero or negative
+# config.CALIB_STEP would make the shunt adjust keys useless, so we fall back
+# to the default step for that.
+_CALIB_STEP_DEF = 0.05
+_CALIB_STEP = CALIB_STEP if CALIB_STEP > 0 else _CALIB_STEP_DEF
+if _CALIB_STEP != CALIB_STEP:
+    logger.error(
+        "Invalid CALIB_STEP %s, must be greater than 0. Using %s.",
+        CALIB_STEP,
+        _CALIB_STEP_DEF,
+    )
+
+# Indexes into the FootMenu option element lists. These are module level
+# consts so that they are inlined by the compiler instead of being looked up
+# on the class on every access. FootMenu still exposes them as class attributes
+# for external use.
+_OPT_OPT = const(0)  # The menu option string is element 0
+_OPT_DESC = const(1)  # The menu description/help is the 2nd element
+_OPT_CB = const(2)  # The menu option callback index
+_OPT_PX = const(3)  # Index for X pixel offset of where the option is displayed.
 
 
 class FootMenu:
@@ -172,13 +296,19 @@ class FootMenu:
                 ]
 
             This list is created from parsing the ``menu`` arg to `__init__`.
+        _opts_display: The option strings from `menu` joined by a single
+            space as displayed by `drawMenu`.
+
+            Since the menu is static after construction, this is built once in
+            `__init__` instead of on every redraw.
     """
 
-    # Constants defining the index to the various menu option config lists
-    OPT_OPT: int = const(0)  # The menu option string is element 0
-    OPT_DESC: int = const(1)  # The menu description/help is the 2nd element
-    OPT_CB: int = const(2)  # The menu option callback index
-    OPT_PX: int = const(3)  # Index for X pixel offset of where the option is displayed.
+    # Constants defining the index to the various menu option config lists.
+    # These are aliases for the module level consts which are used internally.
+    OPT_OPT: int = _OPT_OPT
+    OPT_DESC: int = _OPT_DESC
+    OPT_CB: int = _OPT_CB
+    OPT_PX: int = _OPT_PX
 
     def __init__(self, screen: Screen, menu: list, callback: callable | None = None):
         """
@@ -222,6 +352,9 @@ class FootMenu:
             # leave one space between items. The offset is in pixels.
             offs += (len(opt[0]) + 1) * self._screen.FONT_W
 
+        # Pre-build the options display line since it never changes
+        self._opts_display: str = " ".join(opt[_OPT_OPT] for opt in self.menu)
+
         self._callback: callable = callback
 
         self._active: int = 0
@@ -245,18 +378,17 @@ class FootMenu:
         scr._clear(header_lns=scr._max_rows - 2)
 
         # Draw the options
-        opts = " ".join(opt[self.OPT_OPT] for opt in self.menu)
-        scr.text(opts, fmt="", y=scr._max_rows - 2)
+        scr.text(self._opts_display, fmt="", y=scr._max_rows - 2)
 
         # Show the description
         act = self.menu[self._active]
-        scr.text(act[self.OPT_DESC], fmt="", y=scr._max_rows - 1)
+        scr.text(act[_OPT_DESC], fmt="", y=scr._max_rows - 1)
 
         # Draw top and bottom lines on the active option
         y_offs = (scr._max_rows - 2) * scr.FONT_H
-        x_len = len(act[self.OPT_OPT]) * self._screen.FONT_W
+        x_len = len(act[_OPT_OPT]) * self._screen.FONT_W
         for _ in range(2):
-            scr._display.hline(act[self.OPT_PX], y_offs, x_len, 1)
+            scr._display.hline(act[_OPT_PX], y_offs, x_len, 1)
             y_offs += scr.FONT_H - 1
 
     def selectNext(self, sel_dir: int):
@@ -307,20 +439,20 @@ class FootMenu:
         logger.info(
             "FootMenu for Screen %s: Activate option '%s'",
             self._screen.name,
-            opt[self.OPT_OPT],
+            opt[_OPT_OPT],
         )
 
-        cb = opt[self.OPT_CB] or self._callback
+        cb = opt[_OPT_CB] or self._callback
         if not cb:
             logger.info(
                 "FootMenu for Screen %s: No callback for option '%s'",
                 self._screen.name,
-                opt[self.OPT_OPT],
+                opt[_OPT_OPT],
             )
             return
 
         logger.info("FootMenu for Screen %s: going to call '%s'", self._screen.name, cb)
-        cb(opt[self.OPT_OPT])
+        cb(opt[_OPT_OPT])
 
 
 class Boot(Screen):
@@ -362,11 +494,11 @@ class Boot(Screen):
                 Default is to not update the display.
         """
         # Draws the right side half outer circle filled
-        self._display.ellipse(x, y, rad, rad, 1, True, Q1 | Q4)
+        self._display.ellipse(x, y, rad, rad, 1, True, _LOGO_RIGHT)
         # A smaller full circle in the center also filled
         self._display.ellipse(x, y, rad // 4, rad // 4, 1, True)
         # Clear out the right half of the small center circle
-        self._display.ellipse(x, y, rad // 4, rad // 4, 0, True, Q1 | Q4)
+        self._display.ellipse(x, y, rad // 4, rad // 4, 0, True, _LOGO_RIGHT)
 
         if show:
             self._show()
@@ -486,6 +618,14 @@ class Calibration(Screen):
     Attributes:
 
         AUTO_REFRESH: Sets the auto refresh rate for the screen.
+        SHOW_MIN_MS: Minimum time in milliseconds between display updates
+            triggered from encoder rotation while calibrating.
+
+            Fast encoder rotation can generate ticks much faster than the
+            display can be flushed over I²C. Any ticks arriving within this
+            period after the last display update are only applied to the shunt
+            value, and the display is updated on the next tick after this
+            period, or by the next `AUTO_REFRESH` update.
 
         S_SEL_BC: State: Selecting a BC to calibrate
         S_SEL_CALIB: State: Selecting to calibrate charging or discharging
@@ -511,12 +651,23 @@ class Calibration(Screen):
 
         _shunt_row: The display row on which to put the shunt value display
             while in calibration mode.
+        _dirty: Set True whenever the display buffer has changed and needs to
+            be flushed to the display by `update`.
+        _last_show_ms: The ``ticks_ms`` value of when `update` last flushed the
+            display. Used with `SHOW_MIN_MS`.
+        _sel_bc_opts_cache: The last BC selection options list built by
+            `_setupSelectBC`.
+        _sel_bc_opts_sig: The BC states signature for which
+            `_sel_bc_opts_cache` was built. The options are only rebuilt if
+            any of the BC states changed.
     """
 
     # pylint: disable=too-many-instance-attributes
 
     # Refresh every 200 millis
     AUTO_REFRESH = 200
+    # Coalesce encoder ticks arriving faster than this into one display update
+    SHOW_MIN_MS = 20
 
     # Various internal states
     S_SEL_BC = 0  # Select BC
@@ -545,6 +696,10 @@ class Calibration(Screen):
         self._bc: BatteryController | None = None
         self._curr_mon: "CurrentMonitor" | None = None
         self._shunt_row = 2
+        self._dirty: bool = False
+        self._last_show_ms: int = 0
+        self._sel_bc_opts_cache: list | None = None
+        self._sel_bc_opts_sig: tuple | None = None
 
     def _setupSelectBC(self):
         """
@@ -560,20 +715,30 @@ class Calibration(Screen):
 
         self.text("Select the BC with battery to calibrate", "w^", 0, 2)
 
-        # Only add BCs that have a battery inserted but have not set an ID yet
-        opts = [
-            (str(i), f"Calibrate {bc.name}")
-            for i, bc in enumerate(self._bcms)
-            if bc.state == bc.S_GET_ID
-        ]
-        opts.append(("Exit", "Exit calibration"))
+        # The options only change if any BC state changed, so we reuse the
+        # previous options if the states are the same as last time.
+        sig = tuple(bc.state for bc in self._bcms)
+        if sig != self._sel_bc_opts_sig:
+            # Only add BCs that have a battery inserted but have not set an ID
+            # yet. We build the list directly instead of via a comprehension
+            # to avoid the extra generator object and f-string formatting on
+            # every entry.
+            opts = []
+            for i, bc in enumerate(self._bcms):
+                if bc.state == _S_GET_ID:
+                    opts.append((str(i), "Calibrate " + bc.name))
+            opts.append((_MENU_EXIT, "Exit calibration"))
+            self._sel_bc_opts_cache = opts
+            self._sel_bc_opts_sig = sig
+
         # Set up the footer menu
         self._foot_menu = FootMenu(
             self,
-            opts,
+            self._sel_bc_opts_cache,
             self.footMenuCB,
         )
         self._foot_menu.drawMenu()
+        self._dirty = True
 
         self._state = self.S_SEL_BC
 
@@ -593,9 +758,9 @@ class Calibration(Screen):
 
         # Only add BCs that have a battery inserted but have not set an ID yet
         opts = [
-            ("Ch", "Charging"),
+            (_MENU_CH, "Charging"),
             ("DCh", "Discharging"),
-            ("Exit", "Exit calibration"),
+            (_MENU_EXIT, "Exit calibration"),
         ]
         # Set up the footer menu
         self._foot_menu = FootMenu(
@@ -604,6 +769,7 @@ class Calibration(Screen):
             self.footMenuCB,
         )
         self._foot_menu.drawMenu()
+        self._dirty = True
 
         self._state = self.S_SEL_CALIB
 
@@ -640,6 +806,7 @@ class Calibration(Screen):
             state=True, ch=self._cal_opt == self.C_CH, dch=self._cal_opt == self.C_DCH
         )
 
+        self._dirty = True
         self._state = self.S_CALIB
 
     @property
@@ -659,29 +826,30 @@ class Calibration(Screen):
         # It's OK to access the private value here @pylint: disable=protected-access
         return self._curr_mon._shunt
 
-    @_shunt.setter
-    def _shunt(self, val: int | float):
+    def _adjustShunt(self, steps: int):
         """
-        Setter for the current BC's charge monitor shunt value.
+        Adjusts the current BC's monitor shunt value by a number of
+        `config.CALIB_STEP` increments.
 
-        Note:
-            This is an adjuster for the current shunt, and not an absolute
-            value setter. The ``val`` passed in will be added to the current
-            shunt value, thus adjusting it either up or down (when ``val`` is
-            negative)
+        The adjustment is done directly on `_curr_mon` to bypass the `_shunt`
+        property. The current value is not rounded first, so a calibrated
+        value with sub-milliohm precision is kept until the user adjusts it.
 
         Args:
-            val: A positive or negative integer or float by which to adjust the
-                shunt value
+            steps: A positive or negative number of `config.CALIB_STEP`
+                increments to adjust the shunt value by.
         """
-        self._curr_mon._shunt += val
+        # It's OK to access the private value here @pylint: disable=protected-access
+        cm = self._curr_mon
+        shunt = cm._shunt + steps * _CALIB_STEP
         # We can not let this value go equal to or below zero
-        if self._shunt <= 0:
+        if shunt <= 0:
             self._logger.error(
                 "Screen %s: Shunt value can not go below zero.", self.name
             )
-            # Return to previous
-            self._curr_mon._shunt -= val
+            return
+
+        cm._shunt = shunt
 
     def _saveCalibration(self):
         """
@@ -765,9 +933,15 @@ class Calibration(Screen):
 
         While in the calibration `_state` (`S_CALIB`), this method will update
         the battery current and shunt value display on every call.
+
+        The display is only flushed if something changed (`_dirty`), which is
+        always the case while calibrating.
         """
         # Update values when calibrating
         if self._state == self.S_CALIB:
+            # It's OK to access the private value here @pylint: disable=protected-access
+            cm = self._curr_mon
+            sh = cm._shunt
             # Clear the block to the right of the labels. The X pos is
             # hardcoded here since it's a fairly fixed width.
             self._display.rect(
@@ -780,20 +954,43 @@ class Calibration(Screen):
             )
             # Update shunt value
             self._display.text(
-                f"{self._shunt:0.2f} ohm",
+                f"{sh:0.2f} ohm",
                 7 * self.FONT_W,
                 self._shunt_row * self.FONT_H,
                 1,
             )
             # Update current value
             self._display.text(
-                f"{self._curr_mon.current} mA",
+                f"{cm.current} mA",
                 7 * self.FONT_W,
                 (self._shunt_row + 1) * self.FONT_H,
                 1,
             )
+            self._dirty = True
+
+        if not self._dirty:
+            return
 
         self._show()
+        self._dirty = False
+        self._last_show_ms = time.ticks_ms()
+
+    def _calibTick(self, steps: int):
+        """
+        Handles an encoder tick while calibrating.
+
+        The shunt is always adjusted, but the display is only updated
+        immediately if at least `SHOW_MIN_MS` has passed since the last update.
+        Any coalesced adjustments will be shown on the next tick or
+        `AUTO_REFRESH` update.
+
+        Args:
+            steps: Passed to `_adjustShunt`.
+        """
+        self._adjustShunt(steps)
+        self._dirty = True
+        if time.ticks_diff(time.ticks_ms(), self._last_show_ms) >= self.SHOW_MIN_MS:
+            self.update()
 
     def actCCW(self):
         """
@@ -809,9 +1006,7 @@ class Calibration(Screen):
         """
         # When we're calibrating CCW rotation decreases the shunt value by one
         if self._state == self.S_CALIB:
-            self._shunt = -CALIB_STEP
-            # Update immediately to give instant feedback
-            self.update()
+            self._calibTick(-1)
             return
 
         if self._foot_menu is None:
@@ -837,9 +1032,7 @@ class Calibration(Screen):
         """
         # When we're calibrating CW rotation increases the shunt value by one
         if self._state == self.S_CALIB:
-            self._shunt = CALIB_STEP
-            # Update immediately to give instant feedback
-            self.update()
+            self._calibTick(1)
             return
 
         if self._foot_menu is None:
@@ -930,7 +1123,7 @@ class Calibration(Screen):
         self._foot_menu = None
 
         # Are we exiting?
-        if opt == "Exit":
+        if opt == _MENU_EXIT:
             # Simulate the exit by calling the shortpress now that _foot_menu
             # is None.
             self.actShort()
@@ -952,7 +1145,7 @@ class Calibration(Screen):
 
         # We're in the calibration selection state, with one of the calibration
         # options selected.
-        self._cal_opt = self.C_CH if opt == "Ch" else self.C_DCH
+        self._cal_opt = self.C_CH if opt == _MENU_CH else self.C_DCH
         self._setupCalibration()
 
 
@@ -1021,11 +1214,8 @@ def updateConfig(
 
 
     """  # pylint: disable=too-many-arguments,too-many-positional-arguments,unused-argument,keyword-arg-before-vararg
-    if conf_mod == "config":
-        rt_conf = config
-    elif conf_mod == "net_conf":
-        rt_conf = net_conf
-    else:
+    rt_conf = _CONF_MODULES.get(conf_mod)
+    if rt_conf is None:
         logger.error("updateConfig: Not a valid config module name: %s", conf_mod)
         return
 
@@ -1034,8 +1224,10 @@ def updateConfig(
 
     logger.info("updateConfig: Config update request for config: '%s'", conf_name)
 
-    # Make sure the config option is an attribute of config.
-    if not hasattr(rt_conf, conf_name):
+    # Get the current value, also making sure the config option is an
+    # attribute of config.
+    val = getattr(rt_conf, conf_name, _MISSING)
+    if val is _MISSING:
         logger.error(
             "updateConfig: No config constant named '%s' in module '%s' "
             "to update the value for.",
@@ -1116,9 +1308,6 @@ def updateConfig(
 
             watchdog.WD_LOG_MEM = val
 
-    # Get the value from the config
-    val = getattr(rt_conf, conf_name)
-
     if isinstance(val, bool):
         conf_editor = Toggle(
             conf_name,
@@ -1235,8 +1424,60 @@ class BCMView(Screen):
             This is used in the `update` method to detect if there was a state
             change from the last to the current screen update.
 
+        _next_bcm: Lookup table giving the index in `_bcms` of the next BCM
+            for any BCM index, wrapping around at the end.
+        _prev_bcm: Lookup table giving the index in `_bcms` of the previous
+            BCM for any BCM index, wrapping around at the start.
+
+        _header_str: The centred `_bc` name as shown in the header by
+            `_showHeader`.
+
+            This is only formatted when the active BC is changed in
+            `_activateBCM`.
+
+        _fmt_bv: Format string for the battery voltage line.
+        _fmt_a: Format string for the dis/charge current line.
+        _fmt_ch: Format string for the dis/charge mAh line.
+        _fmt_t: Format string for the dis/charge time line.
+
+            These format strings are built once in `__init__` for the fixed
+            `Screen._max_cols` width.
+
+        _hdr_sig: Signature of the values last drawn by `_showHeader`, or
+            ``None`` if the header needs to be redrawn.
+
+            This must be reset to ``None`` whenever the header area is
+            cleared.
+
+        _disabled_lines: The pre-centred message lines for `_stDisabled`,
+            built on first use.
+
+        _foot_opts: The ``_FM_*`` footer menu definition `_foot_menu` was
+            created from. See `_buildFooter`.
+
+        _foot_handlers: Maps each footer menu option string to the bound
+            method to call when that option is selected. Since most of these
+            are `BatteryController` methods, this is rebuilt by
+            `_activateBCM` for the active BC. Used by `footMenuCB` to dispatch
+            directly to the correct handler.
+
+        _last_t: A ``(seconds, formatted)`` tuple of the last time value
+            formatted by `_fmtTime`.
+
+        _last_render: The render signature of the values last drawn by one of
+            the ``_st*`` state handlers, or ``None`` to force a full redraw.
+
+            See `_renderNeeded`.
+
+        _state_handlers: Maps each `BCStateMachine.state` to the ``_st*``
+            method that handles the display for that state. Used by `update`
+            to dispatch directly to the correct handler.
+
     """
 
+    # Most attributes are small caches so that only what changed is formatted
+    # and drawn on every refresh, so @pylint: disable=too-many-instance-attributes
+
     # The auto refresh rate
     AUTO_REFRESH = 500
 
@@ -1254,6 +1495,39 @@ class BCMView(Screen):
         self._bc: BatteryController | None = None
         self._foot_menu: FootMenu | None = None
         self._last_state: int = -1
+        self._header_str: str = ""
+        self._last_render: tuple | None = None
+        self._disabled_lines: tuple | None = None
+        self._hdr_sig: tuple | None = None
+        self._last_t: tuple = (-1, "")
+        self._foot_opts: tuple | None = None
+        self._foot_handlers: dict = {}
+
+        # Right aligned value line formats for our screen width
+        max_cols = self._max_cols
+        self._fmt_bv: str = "BV: {:>" + str(max_cols - 6) + "d}mV"
+        self._fmt_a: str = "A: {:>" + str(max_cols - 5) + "d}mA"
+        self._fmt_ch: str = "CH: {:>" + str(max_cols - 7) + "d}mAh"
+        self._fmt_t: str = "T: {:>" + str(max_cols - 3) + "}"
+
+        num = len(bcms)
+        self._next_bcm: tuple = tuple((i + 1) % num for i in range(num))
+        self._prev_bcm: tuple = tuple((i - 1) % num for i in range(num))
+
+        bcs = BatteryController
+        self._state_handlers: dict = {
+            bcs.S_DISABLED: self._stDisabled,
+            bcs.S_NOBAT: self._stNoBat,
+            bcs.S_GET_ID: self._stGetID,
+            bcs.S_BAT_ID: self._stBatID,
+            bcs.S_CHARGE: self._stChargeDisCharge,
+            bcs.S_DISCHARGE: self._stChargeDisCharge,
+            bcs.S_CHARGE_PAUSE: self._stChargeDisCharge,
+            bcs.S_DISCHARGE_PAUSE: self._stChargeDisCharge,
+            bcs.S_CHARGED: self._stComplete,
+            bcs.S_DISCHARGED: self._stComplete,
+            bcs.S_YANKED: self._stYanked,
+        }
 
     def _passFocus(self, screen: "Screen" | None, return_to_me: bool = False):
         """
@@ -1265,40 +1539,84 @@ class BCMView(Screen):
                 menu on screen that is not in focus anymore. The various update
                 flows will ensure to recreate this menu again when needed after
                 we receive focus again.
+            * Reset `_last_render` to force a full redraw when we receive
+                focus again.
         """
         self._foot_menu = None
+        self._last_render = None
         super()._passFocus(screen, return_to_me)
 
+    def _renderNeeded(self, sig: tuple) -> bool:
+        """
+        Checks if a state handler needs to redraw the screen.
+
+        The state handlers call this with a tuple of all the values they will
+        display. If these are the same as the last time they were drawn, the
+        redraw and display update can be skipped since nothing changed.
+
+        The last signature is reset (see `_last_render`) whenever the screen
+        is cleared, the state changes, or a new footer menu is created, to
+        force a full redraw.
+
+        Args:
+            sig: The tuple of values to be displayed.
+
+        Returns:
+            True if the screen needs to be redrawn, False otherwise.
+        """
+        if sig == self._last_render:
+            return False
+        self._last_render = sig
+        return True
+
     def _showHeader(self):
         """
         Shows the current `BCStateMachine.name` as a header at the top of
         the screen and the battery ID if available.
 
         This header is shown inverted.
-        """
+
+        The header is only redrawn if any of the values shown in it changed
+        since the last draw. See `_hdr_sig`.
+        """
+        bc = self._bc
+        soc = bc.soc_m
+        in_prog = bool(soc and soc.in_progress)
+        sig = (
+            bc.name,
+            bc.bat_id,
+            in_prog,
+            soc.cycle if soc else -1,
+            soc.cycles if soc else -1,
+        )
+        if sig == self._hdr_sig:
+            return
+        self._hdr_sig = sig
+
         # We are at time called to update the heade without having cleared the
         # screen. In this case, if we do not always clear the header first, the
         # invert further down is going to mess thngs up. So always clear the
         # header line
-        self._display.fill_rect(0, 0, self.px_w, self.FONT_H, 0)
+        display = self._display
+        max_cols = self._max_cols
+        display.fill_rect(0, 0, self.px_w, self.FONT_H, 0)
 
-        header = f"{self._bc.name:^{self._max_cols}}"
-        self._display.text(header, 0, 0, 1)
+        display.text(self._header_str, 0, 0, 1)
         self._invertText(0, 0)
 
         # Show the battery ID if we have one
-        if self._bc.bat_id:
+        bat_id = bc.bat_id
+        if bat_id:
             label = "B_ID:"
-            id_w = self._max_cols - len(label)
-            self._display.text(
-                f"{label}{self._bc.bat_id:>{id_w}.{id_w}}", 0, 1 * self.FONT_H, 1
-            )
+            id_w = max_cols - len(label)
+            display.text(f"{label}{bat_id:>{id_w}.{id_w}}", 0, 1 * self.FONT_H, 1)
 
         # If we are in a SoC measure state, add some SoC info
-        if self._bc.soc_m and self._bc.soc_m.in_progress:
-            self.text("#", x=0, y=0, color=0)
-            cyc = f"{self._bc.soc_m.cycle}/{self._bc.soc_m.cycles}"
-            self.text(cyc, x=self._max_cols - len(cyc), y=0, color=0)
+        if in_prog:
+            text = self.text
+            text("#", x=0, y=0, color=0)
+            cyc = f"{soc.cycle}/{soc.cycles}"
+            text(cyc, x=max_cols - len(cyc), y=0, color=0)
 
     def _activateBCM(self, idx: int | str):
         """
@@ -1308,24 +1626,47 @@ class BCMView(Screen):
             idx: An index into `_bcms` for the one to select and make active.
                 To make it easier cycle through the available BCMs, this can
                 also be the characters '>' or '<' to mean select next or
-                previous BCM respectively.
+                previous BCM respectively. Any other value may also be the
+                index as a numeric string.
         """
         # Validate idx
-        if idx in ("<", ">"):
-            idx = self._active_bcm + (-1 if idx == "<" else 1)
-            # Wrap around?
-            if idx < 0:
-                idx = len(self._bcms) - 1
-            elif idx >= len(self._bcms):
-                idx = 0
-
-        if not isinstance(idx, int):
-            logger.error("Screen %s: invalid bcm index to set: %s", self.name, idx)
-            return
+        if idx == _MENU_NEXT:
+            idx = self._next_bcm[self._active_bcm]
+        elif idx == _MENU_PREV:
+            idx = self._prev_bcm[self._active_bcm]
+        else:
+            # This also allows the index as a numeric string
+            try:
+                idx = int(idx)
+            except (TypeError, ValueError):
+                logger.error("Screen %s: invalid bcm index to set: %s", self.name, idx)
+                return
 
         # Make it active
         self._active_bcm = idx
         self._bc = self._bcms[self._active_bcm]
+        self._header_str = f"{self._bc.name:^{self._max_cols}}"
+        self._last_render = None
+        self._hdr_sig = None
+
+        # Footer menu option handlers for this BC
+        bc = self._bc
+        self._foot_handlers = {
+            # Exit by simulating a short press once _foot_menu is None.
+            _MENU_EXIT: self.actShort,
+            _MENU_RET: self.actShort,
+            # Next BC by simulating a long press once _foot_menu is None.
+            _MENU_NEXT: self.actLong,
+            # Start or cancel SoC measurement
+            _MENU_SOC: bc.socMeasureToggle,
+            _MENU_CANCEL: bc.socMeasureToggle,
+            _MENU_CH: bc.charge,
+            _MENU_DCH: bc.discharge,
+            _MENU_PAUSE: bc.pause,
+            _MENU_CONT: bc.resume,
+            _MENU_STOP: bc.resetMetrics,
+            _MENU_RESET: self._resetBC,
+        }
 
         # Set up the screen.
         self._clear()
@@ -1343,6 +1684,8 @@ class BCMView(Screen):
         if self._active_bcm is None:
             self._activateBCM(0)
         else:
+            self._last_render = None
+            self._hdr_sig = None
             self._clear()
             self._showHeader()
 
@@ -1351,20 +1694,106 @@ class BCMView(Screen):
 
         self._show()
 
+    def _footerOpts(self, state: int) -> tuple | None:
+        """
+        Determines the footer menu definition for the given BC state.
+
+        Args:
+            state: The current `BCStateMachine.state` for `_bc`.
+
+        Returns:
+            One of the static ``_FM_*`` footer menu definitions, or ``None``
+            if the state has no footer menu.
+        """
+        if state == _S_BAT_ID:
+            return _FM_BAT_ID
+
+        if state in _FM_CH_DCH:
+            # The footer menu depends on whether we are busy with a SoC
+            # measurement, paused or just charging
+            return _FM_SOC_RUNNING if self._bc.soc_m.in_progress else _FM_CH_DCH[state]
+
+        if state in (_S_CHARGED, _S_DISCHARGED):
+            # The footer menu is slightly different depending on this being a
+            # SoC measurement still in progress or a normal dis/charge complete
+            soc = self._bc.soc_m
+            if soc.in_progress and soc.state != soc.ST_COMPLETE:
+                return _FM_SOC_RUNNING
+            return _FM_COMPLETE
+
+        if state == _S_YANKED:
+            return _FM_YANKED
+
+        return None
+
+    def _buildFooter(self, state: int):
+        """
+        Creates and draws the footer menu for the given state if needed.
+
+        The footer menu is only (re)created if we do not have one yet, or if
+        the footer menu definition required for the current state (see
+        `_footerOpts`) differs from the one currently shown. This leaves the
+        state handlers to only draw the dynamic values.
+
+        Args:
+            state: The current `BCStateMachine.state` for `_bc`.
+        """
+        opts = self._footerOpts(state)
+        if opts is None:
+            return
+
+        # The definitions are static module level tuples, so an identity test
+        # is enough to see if we already show this menu.
+        if self._foot_menu is not None and opts is self._foot_opts:
+            return
+
+        logger.debug("Creating and showing footer menu for state %s.", state)
+        self._foot_menu = FootMenu(self, opts, self.footMenuCB)
+        self._foot_menu.drawMenu()
+        self._foot_opts = opts
+        # Force a full redraw of the state handler values
+        self._last_render = None
+
+    def _fmtTime(self, secs: int) -> str:
+        """
+        Formats a dis/charge time in seconds as ``hhHmm:ss``.
+
+        The last formatted value is cached in `_last_t` since the time often
+        did not change between screen updates.
+
+        Args:
+            secs: The time in seconds to format.
+
+        Returns:
+            The formatted time string.
+        """
+        if secs != self._last_t[0]:
+            mins, s = divmod(secs, 60)
+            hrs, mins = divmod(mins, 60)
+            self._last_t = (secs, f"{hrs:02d}H{mins:02d}:{s:02d}")
+        return self._last_t[1]
+
     def _stDisabled(self):
         """
         Handles updating the screen for the `BCStateMachine.S_DISABLED` state.
 
         We only display a message to indicate that we are disabled.
         """
+        # This is static content, so only draw it once
+        if not self._renderNeeded(()):
+            return
+
         # Clear the screen, leaving the header in tact.
         self._clear(header_lns=1)
 
         # The .text method does not handle newlines for an open line before
-        # the last line, so we improvise.
-        msg = ["Controller", "disabled.", "", "Press=Exit", "LongPress=Next"]
-        for l, m in enumerate(msg, 2):
-            self._display.text(f"{m:^{self._max_cols}s}", 0, l * self.FONT_H, 1)
+        # the last line, so we improvise. The centred lines are static, so we
+        # only format them once.
+        if self._disabled_lines is None:
+            msg = ("Controller", "disabled.", "", "Press=Exit", "LongPress=Next")
+            self._disabled_lines = tuple(f"{m:^{self._max_cols}s}" for m in msg)
+        for l, m in enumerate(self._disabled_lines, 2):
+            self._display.text(m, 0, l * self.FONT_H, 1)
         self._show()
 
     def _stNoBat(self):
@@ -1374,6 +1803,10 @@ class BCMView(Screen):
         We only display a message to indicate that we are waiting for a battery
         to be inserted.
         """
+        # This is static content, so only draw it once
+        if not self._renderNeeded(()):
+            return
+
         # Clear the screen, leaving the header in tact.
         self._clear(header_lns=1)
 
@@ -1391,7 +1824,7 @@ class BCMView(Screen):
             val: The final ID value
             _: Ignored field ID received from caller.
         """
-        if self._bc.setID(val.decode("ascii")):
+        if self._bc.setID(val):
             logger.info(
                 "Screen %s: Battery ID was set to: %s", self.name, self._bc.bat_id
             )
@@ -1441,31 +1874,17 @@ class BCMView(Screen):
         This state only maintains an updated battery voltage, and a footer menu
         to allow for charging, discharging, etc.
         """
+        bat_v = self._bc.bat_v
+        if not self._renderNeeded((bat_v,)):
+            return
+
         # We should have a battery ID displayed already, we clear only the
         # active bit of the screen, leaving the header, battery ID, and footer
         # menu if it is already there.
         self._clear(header_lns=2, footer_lns=2)
 
-        # Have we created the footer menu yet?
-        if self._foot_menu is None:
-            logger.info("Creating and showing footer menu for S_BAT_ID state.")
-            # Create the footer menu, and draw it
-            self._foot_menu = FootMenu(
-                self,
-                [
-                    (">", "Next BC"),
-                    ("SoC", "Measure SoC"),
-                    ("Ch", "Start Charge"),
-                    ("Dch", "Start Discharge"),
-                    ("Ret", "Exit Screen"),
-                ],
-                self.footMenuCB,
-            )
-            self._foot_menu.drawMenu()
-
         # Show the current battery voltage
-        bv = f"BV: {self._bc.bat_v:>{self._max_cols-6}d}mV"
-        self.text(bv, fmt="", y=3)
+        self.text(self._fmt_bv.format(bat_v), fmt="", y=3)
 
         self._show()
 
@@ -1493,83 +1912,42 @@ class BCMView(Screen):
         When paused, the `FootMenu` will allow resuming, stopping or screen
         exit.
         """
-        # Determine if we charging or discharging, or in a charge or discharge
-        # paused state
-        if self._bc.state in (
-            BatteryController.S_CHARGE_PAUSE,
-            BatteryController.S_DISCHARGE_PAUSE,
-        ):
-            paused = True
-            # We need to set charging based on the type of pause we're in
-            charging = self._bc.state == BatteryController.S_CHARGE_PAUSE
-        else:
-            paused = False
-            # Set charging based of if we charging or dischaging
-            charging = self._bc.state == BatteryController.S_CHARGE
+        bc = self._bc
+        state = bc.state
+        # Determine if we charging or discharging, including the charge paused
+        # state. The paused state only affects the footer menu.
+        charging = state in _CHARGE_STATES
+
+        # Get the current status
+        vals = bc.charge_vals if charging else bc.discharge_vals
+        bat_v = bc.bat_v
+
+        # Nothing to do if none of the displayed values changed
+        if not self._renderNeeded((bat_v, vals[2], vals[4], vals[-1])):
+            return
 
         # We clear only the active bit of the screen, leaving the header,
         # battery ID, and footer menu if it is already there.
         self._clear(header_lns=2, footer_lns=2)
 
-        # Have we created the footer menu yet?
-        if self._foot_menu is None:
-            logger.debug(
-                "Creating and showing footer menu for S_CHARGE/S_DISCHARGE state."
-            )
-            # The footer menu depends on whether we are busy with a SoC
-            # measurement, paused or just charging
-            if self._bc.soc_m.in_progress:
-                # We are busy with a SoC measurement
-                opts = [
-                    (">", "Next BC"),
-                    ("Exit", "Exit Screen"),
-                    ("Cancel", "SoC Measure"),
-                ]
-            elif not paused:
-                opts = [
-                    (">", "Next BC"),
-                    ("Exit", "Exit Screen"),
-                    ("Pause", f"Pause {'Charge' if charging else 'Discharge'}"),
-                ]
-            else:
-                opts = [
-                    (">", "Next BC"),
-                    ("Exit", "Exit Screen"),
-                    ("Cont", f"Resume {'Charge' if charging else 'Discharge'}"),
-                    ("Stop", f"Stop {'Charging' if charging else 'Discharging'}"),
-                ]
-            # Create and show the footer menu
-            self._foot_menu = FootMenu(self, opts, self.footMenuCB)
-            self._foot_menu.drawMenu()
-
-        # Get the current status
-        vals = self._bc.charge_vals if charging else self._bc.discharge_vals
-
         # We show discharging with negative values and charging with positive
         # values. This is only to make it easier to distinguish between the
         # charge and discharge views.
         multiplier = 1 if charging else -1
 
+        text = self.text
+
         # Show the current battery voltage
-        ln = f"BV: {self._bc.bat_v:>{self._max_cols-6}d}mV"
-        self.text(ln, fmt="", y=2)
+        text(self._fmt_bv.format(bat_v), fmt="", y=2)
 
         # The current is the 3rd element in the vals tuple
-        val = vals[2] * multiplier
-        ln = f"A: {val:>{self._max_cols-5}d}mA"
-        self.text(ln, fmt="", y=3)
+        text(self._fmt_a.format(vals[2] * multiplier), fmt="", y=3)
 
         # The mAh is the 5th element in the vals tuple
-        val = vals[4] * multiplier
-        ln = f"CH: {val:>{self._max_cols-7}d}mAh"
-        self.text(ln, fmt="", y=4)
+        text(self._fmt_ch.format(vals[4] * multiplier), fmt="", y=4)
 
         # The time is the last element in vals
-        mins, secs = divmod(vals[-1], 60)
-        hrs, mins = divmod(mins, 60)
-        val = f"{hrs:02d}H{mins:02d}:{secs:02d}"
-        ln = f"T: {val:>{self._max_cols-3}}"
-        self.text(ln, fmt="", y=5)
+        text(self._fmt_t.format(self._fmtTime(vals[-1])), fmt="", y=5)
 
         self._show()
 
@@ -1586,70 +1964,38 @@ class BCMView(Screen):
         metrics, or cancelling an active SoC measure operation, or exit the
         screen.
         """
+        bc = self._bc
+        text = self.text
         # Determine if we are charged or discharged
         # Set charging based of if we charging or discharging
-        charged = self._bc.state == BatteryController.S_CHARGED
+        charged = bc.state == _S_CHARGED
+
+        # Get the current status
+        vals = bc.charge_vals if charged else bc.discharge_vals
+        bat_v = bc.bat_v
+
+        # Nothing to do if none of the displayed values changed
+        if not self._renderNeeded((bat_v, vals[4], vals[-1])):
+            return
 
         # We clear only the active bit of the screen, leaving the header,
         # battery ID, and footer menu if it is already there.
         self._clear(header_lns=2, footer_lns=2)
 
-        # Have we created the footer menu yet, or have the SoC measure
-        # cycle completed?
-        if (
-            self._foot_menu is None
-            or self._bc.soc_m.state == self._bc.soc_m.ST_COMPLETE
-        ):
-            logger.debug(
-                "Creating and showing footer menu for S_CHARGED/S_DISCHARGED state."
-            )
-            # The footer menu is slightly different depending on this being a
-            # SoC measurement still in progress or a normal dis/charge complete
-            if (
-                self._bc.soc_m.in_progress
-                and self._bc.soc_m.state != self._bc.soc_m.ST_COMPLETE
-            ):
-                opts = [
-                    (">", "Next BC"),
-                    ("Exit", "Exit Screen"),
-                    ("Cancel", "SoC Measure"),
-                ]
-            else:
-                opts = [
-                    (">", "Next BC"),
-                    ("Exit", "Exit Screen"),
-                    ("Reset", "Reset Metrics"),
-                ]
-
-            # Create the footer menu, and draw it
-            self._foot_menu = FootMenu(
-                self,
-                opts,
-                self.footMenuCB,
-            )
-
-            self._foot_menu.drawMenu()
-
         # Complete message
-        self.text(f"{'Charge' if charged else 'Discharge'} Done", "^", x=0, y=2)
+        text(f"{'Charge' if charged else 'Discharge'} Done", "^", x=0, y=2)
         self._invertText(0, 2)
 
-        # Get the current status
-        vals = self._bc.charge_vals if charged else self._bc.discharge_vals
-
         # The mAh is the 5th element in the vals tuple
         mah = vals[4]
         # The time is the last element in vals
-        mins, secs = divmod(vals[-1], 60)
-        hrs, mins = divmod(mins, 60)
-        tm = f"{hrs:02d}H{mins:02d}:{secs:02d}"
+        tm = self._fmtTime(vals[-1])
 
         # Show the total charge and time
-        self.text(f"{mah}mAh/{tm}", fmt="^", y=4)
+        text(f"{mah}mAh/{tm}", fmt="^", y=4)
 
         # Show the current battery voltage
-        ln = f"BV: {self._bc.bat_v:>{self._max_cols-6}d}mV"
-        self.text(ln, fmt="", y=5)
+        text(self._fmt_bv.format(bat_v), fmt="", y=5)
 
         self._show()
 
@@ -1660,23 +2006,13 @@ class BCMView(Screen):
         It will show a message to indicate that the battery was removed anda
         `FootMenu` to allow resetting the controller or exiting the screen.
         """
+        # This is static content, so only draw it once
+        if not self._renderNeeded(()):
+            return
+
         # Clear the screen, leaving the header and footer menu in tact.
         self._clear(header_lns=1, footer_lns=2)
 
-        # Have we created the footer menu yet?
-        if self._foot_menu is None:
-            logger.info("Creating and showing footer menu for S_YANKED state.")
-            # Create the footer menu, and draw it
-            self._foot_menu = FootMenu(
-                self,
-                [
-                    ("Reset", "Reset Controller"),
-                    ("Exit", "Exit Screen"),
-                ],
-                self.footMenuCB,
-            )
-            self._foot_menu.drawMenu()
-
         self.text("Battery removed.", fmt="w^", y=3)
         self._show()
 
@@ -1688,70 +2024,35 @@ class BCMView(Screen):
 
         This method will simply determine the current battery state, whether
         there was a state change from the previous to current call, and then
-        call the correct handler to manage the display for the given state.
+        call the correct handler from `_state_handlers` to manage the display
+        for the given state.
         """
-        # We have a lot of flow here, so
-        # @pylint: disable=too-many-return-statements,too-many-branches
-
         # If we do not have an active BCM set yet, we just return
         if self._active_bcm is None:
             return
 
         # Get the current status
-        state = self._bc.state
+        bc = self._bc
+        state = bc.state
         # Very weird syntax, but this sets state_changed True is the new state
         # is not the same as the last state, i.o.w. a state changed happened
         # since our last call, and then if there was a state change we update
         # self._last_state to the current state.
         if state_changed := state != self._last_state:
             self._last_state = state
+            self._last_render = None
             # If we are now in SoC measure progress, also update the header
-            if self._bc.soc_m and self._bc.soc_m.in_progress:
+            soc = bc.soc_m
+            if soc and soc.in_progress:
                 self._showHeader()
 
-        # Disabled?
-        if state == BatteryController.S_DISABLED:
-            self._stDisabled()
-            return
-
-        # Are we waiting for a battery to be inserted?
-        if state == BatteryController.S_NOBAT:
-            self._stNoBat()
-            return
-
-        if state == BatteryController.S_GET_ID:
-            self._stGetID()
-            return
-
-        # If we get here, we should have a battery ID already, and it would
-        # have been displayed by our setup after receiving focus back from the
-        # battery ID input FieldEdit screen.
-
-        if state == BatteryController.S_BAT_ID:
-            self._stBatID()
-            return
-
-        if state in (
-            BatteryController.S_CHARGE,
-            BatteryController.S_DISCHARGE,
-            BatteryController.S_CHARGE_PAUSE,
-            BatteryController.S_DISCHARGE_PAUSE,
-        ):
-            if state_changed:
-                self._foot_menu = None
-            self._stChargeDisCharge()
-            return
-
-        if state in (BatteryController.S_CHARGED, BatteryController.S_DISCHARGED):
+        handler = self._state_handlers.get(state)
+        if handler is not None:
+            # Any footer menu from a previous state is not valid anymore
             if state_changed:
                 self._foot_menu = None
-            self._stComplete()
-            return
-
-        if state == BatteryController.S_YANKED:
-            if state_changed:
-                self._foot_menu = None
-            self._stYanked()
+            self._buildFooter(state)
+            handler()
             return
 
         # Clear the screen, leaving the header in tact.
@@ -1841,7 +2142,7 @@ class BCMView(Screen):
         """
         logger.info("Screen %s: Activating next BCM.", self.name)
         self._foot_menu = None
-        self._activateBCM(">")
+        self._activateBCM(_MENU_NEXT)
 
     def footMenuCB(self, opt: str):
         """
@@ -1857,8 +2158,8 @@ class BCMView(Screen):
         a call to `actShort()`, effectively simulating a short press to exit
         the screen.
 
-        For all other options we call the appropriate handler, sometimes also
-        based on the state. See the code for moredetails.
+        For all other options we call the appropriate handler from
+        `_foot_handlers`.
 
         Args:
             opt: The foot menu option string that was active when the option
@@ -1868,45 +2169,24 @@ class BCMView(Screen):
         # First thing to do is unset the current footer menu
         self._foot_menu = None
 
-        # Are we exiting?
-        if opt in ["Exit", "Ret"]:
-            # Simulate the exit by calling the shortpress now that _foot_menu
-            # is None.
-            self.actShort()
+        handler = self._foot_handlers.get(opt)
+        if handler is None:
+            logger.info("Received invalid option from footer menu: %s", opt)
+            return
 
-        # Go to next BC?
-        if opt == ">":
-            # Simulate switching to the next BC by simulating the longpress now
-            # that _foot_menu is None.
-            self.actLong()
-
-        if opt in ("SoC", "Cancel"):
-            # These are to start or cancel a SoC measurement. For either we use
-            # the convenient toggle
-            self._bc.socMeasureToggle()
-        elif opt == "Ch":
-            # Switch charging on
-            self._bc.charge()
-        elif opt == "Dch":
-            # Switch discharging on
-            self._bc.discharge()
-        elif opt == "Pause":
-            # Pause charge/dischar
-            self._bc.pause()
-        elif opt == "Cont":
-            # Resume after pause
-            self._bc.resume()
-        elif opt == "Stop":
-            # Stop charging/dischargin
-            self._bc.resetMetrics()
-        elif opt == "Reset":
-            if self._bc.state == self._bc.S_YANKED:
-                self._bc.reset()
-            else:
-                self._bc.resetMetrics()
+        handler()
 
+    def _resetBC(self):
+        """
+        Footer menu handler for the ``Reset`` option.
+
+        A yanked BC is fully reset, while for any other state we only reset
+        the metrics.
+        """
+        if self._bc.state == _S_YANKED:
+            self._bc.reset()
         else:
-            logger.info("Received invalid option from footer menu: %s", opt)
+            self._bc.resetMetrics()
 
 
 def uiSetup(bcms: list):
@@ -142,6 +142,8 @@ Warning:
       space available to do so.
 """
 
+import sys
+
 
 def overrideLocal(mod: str, mod_locals: dict):
     """
@@ -159,16 +161,46 @@ def overrideLocal(mod: str, mod_locals: dict):
         mod_locals: The config modules ``locals`` namesapace dict. Just pass the
             config module directly. Assuming the same setup as described above,
             the value for this arg will then just be ``conf``
+
+    Note:
+        A missing local file is not an error. Any other error while importing
+        the site local module, like a ``SyntaxError`` or ``NameError`` in the
+        local file, is logged and the local overrides are ignored so that the
+        defaults are still available.
     """
-    # @pylint: disable=exec-used,bare-except
     try:
-        local_f = f"{mod}_local"
-        exec(f"from {local_f} import *", mod_locals)
-    except:
-        # Here we could test for file not found or import errors and wearn if there
-        # are errors in the local file as opposed to no file at all.
-        # For now, we just ignore it.
-        pass
+        # We import the module directly instead of exec'ing a
+        # "from .. import *" which would need the runtime compiler.
+        local_mod = __import__(f"{mod}_local")
+    except ImportError:
+        # No site local config for this module
+        return
+    except Exception as ex:
+        # A broken local file should not stop us from booting with defaults.
+        # We may be called while the config modules are still being imported,
+        # so we do not use the logger here.
+        print(f"Error loading site local config for {mod}: {ex!r}", file=sys.stderr)
+        return
+
+    _copyPublic(local_mod, mod_locals)
+
+
+def _copyPublic(local_mod, mod_locals: dict):
+    """
+    Copies the public names from a site local module into a config module
+    namespace, the same as ``from local_mod import *`` would do.
+
+    Args:
+        local_mod: The imported site local module.
+        mod_locals: The config module ``locals`` namespace dict to update.
+    """
+    # All public names, or those in __all__ if defined
+    names = getattr(local_mod, "__all__", None)
+    if names is None:
+        names = [n for n in dir(local_mod) if not n.startswith("_")]
+
+    for n in names:
+        mod_locals[n] = getattr(local_mod, n)
 
 
 def updateLocal(names: str | list, conf_mod):
@@ -185,15 +217,18 @@ def updateLocal(names: str | list, conf_mod):
         conf_mod: The config module for which the configs defined by ``names``
             should be saved as site local values.
     """
-    import os
-
     # Default names to a list if it is not a list or tuple
     if not isinstance(names, (list, tuple)):
         names = [names]
 
-    # If we are here, globals() seems to be limited to this module, and
-    # therefore the vars to make local in names should be in globals()
-    to_update = {n: getattr(conf_mod, n) for n in dir(conf_mod) if n in names}
+    # Get the current values for all names to update from the config module,
+    # skipping any that does not exist there.
+    to_update = {}
+    for n in names:
+        try:
+            to_update[n] = getattr(conf_mod, n)
+        except AttributeError:
+            pass
     if not to_update:
         print("Nothing to update.")
     else:
@@ -201,22 +236,55 @@ def updateLocal(names: str | list, conf_mod):
 
     local_f = f"{conf_mod.__name__}_local.py"
 
-    out = ""
-    # Get the current local config file contents, replacing all values to
-    # update
-    if local_f in os.listdir():
-        with open(local_f, "r", encoding="utf-8") as cf:
-            while ln := cf.readline():
-                var = ln.split(" ")[0]
-                if not var in to_update:
-                    out += ln
-                else:
-                    out += f"{var} = {to_update[var]}\n"
-                    del to_update[var]
+    # We collect the output lines in a list and write them line by line,
+    # instead of repeatedly concatenating immutable strings, or joining them
+    # into one large string again.
+    # Values are written using their repr() so that strings are quoted and can
+    # be imported again.
+    out = _readLocal(local_f, to_update)
 
     # Add anything we did not already update
     for n, v in to_update.items():
-        out += f"{n} = {v}\n"
+        out.append(f"{n} = {v!r}\n")
 
     with open(local_f, "w", encoding="utf-8") as cf:
-        cf.write(out)
+        for ln in out:
+            cf.write(ln)
+
+
+def _readLocal(local_f: str, to_update: dict) -> list:
+    """
+    Reads the current site local config file lines, replacing the values for
+    any names in ``to_update``.
+
+    Args:
+        local_f: The site local config file name.
+        to_update: Names and new values to replace in the file. Any names
+            replaced are removed from this dict, leaving only those that still
+            need to be added.
+
+    Returns:
+        A list of the file lines, each ending in a newline, or an empty list
+        if the file does not exist yet.
+    """
+    out = []
+    # We simply try to open it instead of scanning the directory listing to
+    # see if it exists.
+    try:
+        cf = open(local_f, "r", encoding="utf-8")
+    except OSError:
+        return out
+
+    with cf:
+        while ln := cf.readline():
+            var = ln.split(" ", 1)[0]
+            if not var in to_update:
+                # Make sure we do not join to any line we may add below
+                if ln[-1] != "\n":
+                    ln += "\n"
+                out.append(ln)
+            else:
+                out.append(f"{var} = {to_update[var]!r}\n")
+                del to_update[var]
+
+    return out
@@ -50,22 +50,39 @@ Attributes:
         * ``MQTT_WILL_MESSAGE`` - No message if not defined
         * ``MQTT_WILL_QOS`` - defaults to 0 if not defined
         * ``MQTT_WILL_RETAIN`` - defaults to ``False`` if not defined.
+        * ``MQTT_CLEAN_SESSION`` - defaults to ``True`` if not defined. If
+          ``False``, the broker keeps our session, including the control topic
+          subscription, between reconnects, and we only subscribe on the first
+          connection. See `_onConnect`.
 
     PUB_TOPICS: A list of topics for the messages in the `PUB_Q`. See
         `queueMsq` for more details.
 
-    PUB_Q: Queue for any outgoing messages. Use `queueMsq` to add to this queue.
+    _TOPIC_IDX: Maps each topic string in `PUB_TOPICS` to it's index (the
+        ``topic_id``) so `queueMsq` does not have to scan `PUB_TOPICS`.
+
+    PUB_Q: Queue (``deque``) for any outgoing messages. Use `queueMsq` to add
+        to this queue.
 
     Q_MAX_LEN: Maximum number of messages that are allowed to queue before we
         start discarding the oldest. This is done by `queueMsq`
 
-    CB_MAP: A dictionary that maps a received message string (key) to a
+    PUB_QOS: The QoS for publishing messages from `net_conf.MQTT_PUB_QOS`.
+        This will be forced to 0 with a warning logged unless
+        `net_conf.MQTT_ALLOW_QOS1` is also True.
+
+    PUB_EVENT: An ``asyncio.Event`` set by `queueMsq` whenever a message is
+        added to `PUB_Q`. The `mqManager` waits on this to publish all
+        messages queued in one go as soon as they are available.
+
+    CB_MAP: A dictionary that maps a received message (``bytes`` key) to a
         callback coro.
 
         When a message is received on any of the topics subscribed to
         (`net_conf.MQTT_CTL_TOPIC`), this message is looked up in this map. If
         found, the value is expected to be a pointer to an asyncio callback
-        function (coro) that will be awaited on.
+        function (coro) that will be awaited on. The keys are ``bytes`` so the
+        raw message can be looked up without decoding it first.
 
         The coro signature is as follows:
 
@@ -76,20 +93,36 @@ Attributes:
     SHUTDOWN: Flag that can be set to True to close the MQTT connection and
         shut down the `mqManager`
 
+    _MQ_STATE: Runtime state kept across MQTT client connections. This is a
+        dict so it can be updated in place without rebinding a module global.
+
+        * ``subscribed`` - Set True by `_onConnect` once we have subscribed to
+          the control topic.
+        * ``resyncs`` - Incremented whenever `queueMsq` drops the oldest
+          message from a full `PUB_Q`, and on every new connection. Any
+          messages may have been lost then, so `broadcast` sends full
+          messages again for all BCs when it sees this change.
+
     logger: Local module logger.
 
 .. _MQTT: https://en.wikipedia.org/wiki/MQTT
 .. _`Async MQTT`: https://github.com/Tangerino/aiomqttc
 """
 
-import random
 import json
+from collections import deque
 import uasyncio as asyncio
 import utime as time
+from micropython import const
 from lib.aiomqttc import MQTTClient
 from lib.ulogging import getLogger, telemetry_logs
-from lib.bat_controller import BatteryController, telemetry_trigger
-from config import TELEMETRY_EMIT_FREQ
+from lib.bat_controller import BatteryController, telemetry_trigger, telemetry_event
+from config import (
+    TELEMETRY_EMIT_FREQ,
+    TELEMETRY_BAT_V_DELTA,
+    TELEMETRY_DELTA_FULL,
+    TELEMETRY_COMBINED,
+)
 
 # This is to get net_conn.IS_CONNECTED - Do not try to only import IS_CONNECTED
 # since this will give us a copy of what IS_CONNECTED was at the time of
@@ -97,7 +130,6 @@ from config import TELEMETRY_EMIT_FREQ
 import net_conn
 import net_conf
 
-
 CONFIG: dict = {
     "server": net_conf.MQTT_HOST,
     "port": getattr(net_conf, "MQTT_PORT", 1883),
@@ -108,19 +140,52 @@ CONFIG: dict = {
     "will_message": getattr(net_conf, "MQTT_WILL_MESSAGE", None),
     "will_qos": getattr(net_conf, "MQTT_WILL_QOS", 0),
     "will_retain": getattr(net_conf, "MQTT_WILL_RETAIN", False),
-    "clean_session": True,
+    "clean_session": getattr(net_conf, "MQTT_CLEAN_SESSION", True),
     "verbose": 0,
 }
 
 PUB_TOPICS: list = []
-PUB_Q: list = []
+_TOPIC_IDX: dict = {}
 Q_MAX_LEN = 10
+# The deque drops the oldest message when appending to a full queue.
+PUB_Q: deque = deque((), Q_MAX_LEN)
+PUB_EVENT = asyncio.Event()
 
 SHUTDOWN = False
+_MQ_STATE: dict = {
+    "subscribed": False,
+    "resyncs": 0,
+}
+
+# Max time in milliseconds the broadcast loop waits for a telemetry_event
+# before checking the BCs again. While any BC is waiting for the battery
+# voltage to settle we check often, otherwise we only wake up every now and
+# then to publish any logs, or at the next periodic emit deadline if sooner.
+_POLL_ACTIVE_MS = const(250)
+_POLL_IDLE_MS = const(2000)
+
+# Compact separators for the telemetry JSON messages. MicroPython has no
+# JSONEncoder class to keep an instance of, but json.dumps accepts these.
+_JSON_SEP = (",", ":")
+
+# BC states in which we emit progress telemetry every TELEMETRY_EMIT_FREQ.
+_PROG_STATES = (BatteryController.S_CHARGE, BatteryController.S_DISCHARGE)
 
 
 logger = getLogger(__name__)
 
+# A QoS other than 0 is only allowed if explicitly enabled
+PUB_QOS: int = (
+    net_conf.MQTT_PUB_QOS
+    if net_conf.MQTT_PUB_QOS == 0 or net_conf.MQTT_ALLOW_QOS1
+    else 0
+)
+if PUB_QOS != net_conf.MQTT_PUB_QOS:
+    logger.warning(
+        "MQTT_PUB_QOS=%s not allowed without MQTT_ALLOW_QOS1. Using QoS 0.",
+        net_conf.MQTT_PUB_QOS,
+    )
+
 
 # Callback functions for control messages. These should probably be defined in
 # a submodule to make this module more generic, but for now we do it here.
@@ -157,17 +222,17 @@ async def returnResetLog(tpc, msg):
 
 # Map of callback functions for any received messages.
 CB_MAP = {
-    "get_reset_log": returnResetLog,
+    b"get_reset_log": returnResetLog,
 }
 
 
-def queueMsq(topic: str | int, msg: str | None) -> int:
+def queueMsq(topic: str | int, msg: str | None, replace: bool = False) -> int:
     """
     Interface to add a message to the publish queue (`PUB_Q`).
 
     Each message must have a topic to be published on.
 
-    The `PUB_Q` is a FIFO queue consisting of a (possibly empty) list of 2-tuples:
+    The `PUB_Q` is a FIFO queue consisting of a (possibly empty) deque of 2-tuples:
 
         (topic_id, message)
 
@@ -193,11 +258,19 @@ def queueMsq(topic: str | int, msg: str | None) -> int:
     If ``topic`` is an integer that does not have and index in `PUB_TOPICS`,
     and error will be logged and the message discarded.
 
+    If ``replace`` is True and the newest message for the same topic is still
+    waiting in the queue, that message is replaced with this one instead of
+    adding it. The caller must make sure this message supersedes that one,
+    like a newer full BC snapshot in the same state. The message at the head
+    of the queue is never replaced since it may be busy being published.
+
     Args:
         topic: The topic to publish the message on. This can either be a string
             or an integer to indicate the topic ID. See above.
         msg: If not None or empty, will be appended to the `PUB_Q` FIFO message
             queue.
+        replace: If True, replace the newest message for the same topic if
+            still waiting in the queue. See above.
 
     Returns:
         The topic ID (index into `PUB_TOPICS`) used for the topic on success,
@@ -205,10 +278,11 @@ def queueMsq(topic: str | int, msg: str | None) -> int:
     """
     # Handle a string topic
     if isinstance(topic, str):
-        topic_id = PUB_TOPICS.index(topic) if topic in PUB_TOPICS else None
+        topic_id = _TOPIC_IDX.get(topic)
         if topic_id is None:
             PUB_TOPICS.append(topic)
             topic_id = len(PUB_TOPICS) - 1
+            _TOPIC_IDX[topic] = topic_id
             logger.debug("Added new publish topic at ID %d : %s", topic_id, topic)
     else:
         # We assume it's an integer - caller will feel it if not...
@@ -222,14 +296,23 @@ def queueMsq(topic: str | int, msg: str | None) -> int:
         logger.debug("Not adding empty message to publish queue.")
         return topic_id
 
-    # Are we at the max queue len?
+    # Replace the newest waiting message for this topic. We skip the head of
+    # the queue since _publishQueue only removes it after it was published.
+    if replace:
+        for i in range(len(PUB_Q) - 1, 0, -1):
+            if PUB_Q[i][0] == topic_id:
+                PUB_Q[i] = (topic_id, msg)
+                PUB_EVENT.set()
+                return topic_id
+
+    # Are we at the max queue len? The append below will then drop the oldest
     if len(PUB_Q) == Q_MAX_LEN:
-        # Remove the oldest
-        res = PUB_Q.pop(0)
-        logger.info("Max PUB_Q len reached. Removed oldest: %s", res)
+        logger.info("Max PUB_Q len reached. Removing oldest: %s", PUB_Q[0])
+        _MQ_STATE["resyncs"] += 1
 
-    # Add to queue
+    # Add to queue and wake up the publisher
     PUB_Q.append((topic_id, msg))
+    PUB_EVENT.set()
 
     return topic_id
 
@@ -240,17 +323,36 @@ async def _onConnect(client, rc):
 
     For now, all we do it subscribe to the `net_conf.MQTT_CTL_TOPIC`.
 
+    When not using a clean session (see ``MQTT_CLEAN_SESSION`` in `CONFIG`),
+    the broker keeps the subscription for our session between reconnects, so
+    we only subscribe on the first connection after startup.
+
     If we will every make this module more dynamic, and not closely linked to
     this project as it is now, we will have to define topics and their
     callbacks more dynamically.
 
     If any subscribed messages are received, they will be handled by the
     `_msgRX` coro.
+
+    If `net_conf.MQTT_CTL_TOPIC` is not set, or there are no callbacks in
+    `CB_MAP`, remote control is disabled and we do not subscribe at all.
     """
+    # Any messages published just before a disconnect may have been lost
+    _MQ_STATE["resyncs"] += 1
+
+    if not (getattr(net_conf, "MQTT_CTL_TOPIC", None) and CB_MAP):
+        logger.info("_onConnect: connected with rc [%s]. Remote control disabled.", rc)
+        return
+
+    if _MQ_STATE["subscribed"] and not CONFIG["clean_session"]:
+        logger.info("_onConnect: reconnected with rc [%s]. Session resumed.", rc)
+        return
+
     logger.info("_onConnect: connected with rc [%s]. Subscribing to topics...", rc)
 
     # Subscribe to the control topic
     await client.subscribe(f"{net_conf.MQTT_CTL_TOPIC}/#", 0)
+    _MQ_STATE["subscribed"] = True
 
 
 async def _msgRX(client: MQTTClient, topic: str, message: bytes, retain: bool):
@@ -270,14 +372,11 @@ async def _msgRX(client: MQTTClient, topic: str, message: bytes, retain: bool):
 
     logger.info("_msgRX: Received MQTT message on %s: %s", topic, message)
 
-    # Convert to strings
-    msg = message.decode()
-
-    # Do we have a callback?
-    cb = CB_MAP.get(msg, None)
-    # Await on it if set
+    # Do we have a callback? The keys are bytes, so no need to decode first.
+    cb = CB_MAP.get(message, None)
+    # Await on it if set, only now converting the message to a string
     if cb:
-        await cb(topic, msg)
+        await cb(topic, message.decode())
 
 
 async def _clientConnect() -> MQTTClient:
@@ -334,7 +433,10 @@ async def _clientConnect() -> MQTTClient:
             logger.info("Connected to MQTT broker.")
             break
         logger.error("Failed to connect to broker, retrying in %s seconds...", delay)
-        await asyncio.sleep(delay + random.uniform(0, 0.5 * delay))
+        # Jitter of up to about half the delay from the low bits of the us
+        # ticker, which avoids the float RNG and the random module.
+        jitter_ms = (time.ticks_us() & 0x3FF) * delay // 2
+        await asyncio.sleep_ms(delay * 1000 + jitter_ms)
         delay = min(delay * 2, mqtt_retry_max_delay)
 
     return client
@@ -360,7 +462,7 @@ async def _publishQueue(client: MQTTClient):
         # Get the topic id and message for the first message in the queue, and
         # publish it
         topic_id, msg = PUB_Q[0]
-        res = await client.publish(PUB_TOPICS[topic_id], msg)
+        res = await client.publish(PUB_TOPICS[topic_id], msg, qos=PUB_QOS)
         if not res:
             logger.error(
                 "Error publishing message: topic=[%s], msg=[%s], Err: %s",
@@ -371,7 +473,7 @@ async def _publishQueue(client: MQTTClient):
             # No point in continuing, so we return
             return res
         # Remove it from the queue
-        PUB_Q.pop(0)
+        PUB_Q.popleft()
 
     return True
 
@@ -404,7 +506,15 @@ async def mqManager():
                 # out to retry the connection
                 if not res:
                     break
-                await asyncio.sleep(1)
+                # Wait for new messages to be queued, but at most 1 sec so we
+                # still check the connection regularly. Since the broadcaster
+                # queues all messages for one pass before yielding, they will
+                # all be published together on the next pass.
+                try:
+                    await asyncio.wait_for(PUB_EVENT.wait(), 1)
+                except asyncio.TimeoutError:
+                    pass
+                PUB_EVENT.clear()
 
             logger.error("Disconnected from MQTT broker")
             await client.disconnect()
@@ -461,8 +571,9 @@ def buildMsg(bc: BatteryController) -> dict:
     """
 
     msg = {"state": bc.state_name}
+    st = bc.state
 
-    if bc.state == bc.S_DISABLED:
+    if st == bc.S_DISABLED:
         # Nothing more for disabled.
         return msg
 
@@ -470,33 +581,30 @@ def buildMsg(bc: BatteryController) -> dict:
     if bc.bat_id:
         msg["bat_id"] = bc.bat_id
 
-    if bc.state not in [
-        bc.S_BAT_ID,
-        bc.S_CHARGE,
-        bc.S_DISCHARGE,
-        bc.S_CHARGED,
-        bc.S_DISCHARGED,
-    ]:
-        # Any state other than the above we do not have anything else to add.
+    # Get the charge monitor with the details for the state if we are
+    # charging or discharging or in SoC measurement cycle.
+    # @pylint: disable=protected-access
+    mon = bc._mon_for_state.get(st)
+
+    if mon is None:
+        # Only the battery voltage for a battery with id, and nothing else to
+        # add for any other state.
+        if st == bc.S_BAT_ID:
+            msg["bat_v"] = bc.bat_v
         return msg
 
     # Always add the battery voltage
     msg["bat_v"] = bc.bat_v
 
-    # Nothing more for only battery with id
-    if bc.state == bc.S_BAT_ID:
-        return msg
-
-    # We are charging or discharging or in SoC measurement cycle. Add the
-    # correct charge monitor details.  @pylint: disable=protected-access
-    mon = bc._ch_mon if bc.state in (bc.S_CHARGE, bc.S_CHARGED) else bc._dch_mon
-
     msg["adc_v"] = mon.voltage
     msg["current"] = mon.current
     msg["charge"] = mon.charge
     msg["mAh"] = mon.mAh
-    msg["tm"] = round(mon.charge_time / 1000)
-    msg["shunt"] = mon._shunt
+    # Integer rounding of the ms time to seconds
+    msg["tm"] = (mon.charge_time + 500) // 1000
+    # Shunt values are set with milliohm resolution, so avoid sending any
+    # float noise beyond that.
+    msg["shunt"] = round(mon._shunt, 3)
 
     if bc.soc_m.in_progress:
         msg["soc_measure"] = {
@@ -510,6 +618,195 @@ def buildMsg(bc: BatteryController) -> dict:
     return msg
 
 
+def _nextEmit(deadline: int, now: int, restart: bool) -> int:
+    """
+    Calculates the next periodic emit deadline for a BC after an emit.
+
+    Once the current ``deadline`` has been reached, the next one is advanced
+    from it by `config.TELEMETRY_EMIT_FREQ`, so any lateness in waking up does
+    not accumulate. If the emit was before the deadline, the deadline stays.
+
+    Args:
+        deadline: The current emit deadline in ``ticks_ms``.
+        now: The current ``ticks_ms`` time.
+        restart: If True, like on a state change, a new deadline is started
+            from ``now``. This is also done if we fell more than a full period
+            behind.
+
+    Returns:
+        The next emit deadline in ``ticks_ms``.
+    """
+    if not restart and time.ticks_diff(now, deadline) >= 0:
+        deadline = time.ticks_add(deadline, TELEMETRY_EMIT_FREQ)
+        restart = time.ticks_diff(deadline, now) <= 0
+    if restart:
+        deadline = time.ticks_add(now, TELEMETRY_EMIT_FREQ)
+    return deadline
+
+
+def _waitInterval(bcs: list[BatteryController,], state: dict) -> int:
+    """
+    Calculates how long `broadcast` may wait for a `telemetry_event`.
+
+    Args:
+        bcs: The BCs being monitored.
+        state: The `broadcast` state dict, keyed on BC.
+
+    Returns:
+        The shortest of the time in milliseconds until the earliest periodic
+        emit deadline of any charging or discharging BC, `_POLL_ACTIVE_MS` if
+        any BC is in the battery ID state, or `_POLL_IDLE_MS`.
+    """
+    interval = _POLL_IDLE_MS
+    now = time.ticks_ms()
+    for bc in bcs:
+        st = bc.state
+        if st in _PROG_STATES:
+            due = time.ticks_diff(state[bc]["next_emit"], now)
+            interval = min(interval, max(0, due))
+        elif st == BatteryController.S_BAT_ID:
+            interval = min(interval, _POLL_ACTIVE_MS)
+    return interval
+
+
+def _needsEmit(bc: BatteryController, bc_st: dict, now: int) -> bool:
+    """
+    Checks if telemetry needs to be emitted for a BC.
+
+    Args:
+        bc: The BC to check.
+        bc_st: The `broadcast` state for this BC.
+        now: The current ``ticks_ms`` time.
+
+    Returns:
+        True if any of the emit conditions are met for the BC.
+    """
+    st = bc.state
+
+    # There are a number of conditions that can cause telemetry data to be
+    # emitted. If any one of them are true for this BC, we emit telemetry.
+    return (
+        # Anytime a status changes - compared with our saved state
+        (bc_st["state"] != st)
+        # When in S_BAT_ID state (after dis/charge) the battery voltage takes
+        # time to stabilize. We keep record of the voltage in the BC state
+        # structure and then check for changes, ignoring changes smaller than
+        # TELEMETRY_BAT_V_DELTA.
+        or (
+            st == BatteryController.S_BAT_ID
+            and abs(bc.bat_v - bc_st["bat_v"]) >= TELEMETRY_BAT_V_DELTA
+        )
+        # When in one of the continues emit states (dis/charging), and emit
+        # time is reached
+        or (st in _PROG_STATES and time.ticks_diff(now, bc_st["next_emit"]) >= 0)
+    )
+
+
+def _queueBCMsg(bc_st: dict, msg: dict, last: dict | None):
+    """
+    Queues a full or delta telemetry message for a BC.
+
+    Only the changes are published on the delta topic if delta messages are
+    enabled, the state is the same, no values were removed and it is not
+    time for a full message yet. Otherwise the full message is published on
+    the BC topic.
+
+    Args:
+        bc_st: The `broadcast` state for the BC.
+        msg: The new message from `buildMsg`.
+        last: The last message published for the BC, or None if there is no
+            previous message to build a delta on.
+    """
+    # Does this message supersede the last one: same state and no values
+    # were removed.
+    same = (
+        last is not None
+        and last["state"] == msg["state"]
+        and all(k in msg for k in last)
+    )
+    if TELEMETRY_DELTA_FULL and same and bc_st["deltas"] < TELEMETRY_DELTA_FULL:
+        bc_st["deltas"] += 1
+        delta = {k: v for k, v in msg.items() if last.get(k) != v}
+        queueMsq(bc_st["delta_topic"], json.dumps(delta, separators=_JSON_SEP))
+        return
+
+    bc_st["deltas"] = 0
+    # If it supersedes the last message, that one may be replaced if still
+    # waiting in the queue. The last message for a state, like the final
+    # charge values, is never replaced by a message for the next state. Not
+    # done if deltas are enabled, since those build on the last full message.
+    queueMsq(
+        bc_st["topic"],
+        json.dumps(msg, separators=_JSON_SEP),
+        replace=same and not TELEMETRY_DELTA_FULL,
+    )
+
+
+def _emitTriggered(state: dict, now: int, all_topic: int | None):
+    """
+    Emits telemetry for all BCs in `telemetry_trigger`, removing them from
+    the list as we go.
+
+    Messages that did not change since the last one for a BC are skipped. If
+    `config.TELEMETRY_COMBINED` is set, the messages are collected and queued
+    as one message on ``all_topic``, else each one is queued by `_queueBCMsg`.
+
+    Args:
+        state: The `broadcast` state dict, keyed on BC.
+        now: The current ``ticks_ms`` time.
+        all_topic: The topic ID for combined messages if enabled.
+    """
+    combined = {}
+    for _ in range(len(telemetry_trigger)):
+        # Remove it from the trigger list
+        bc = telemetry_trigger.pop(0)
+
+        # State updates:
+        bc_st = state[bc]
+        # Set it's next emit time, restarting the period on state changes
+        st = bc.state
+        bc_st["next_emit"] = _nextEmit(bc_st["next_emit"], now, bc_st["state"] != st)
+        # Update the state
+        bc_st["state"] = st
+        # And the battery voltage
+        bc_st["bat_v"] = bc.bat_v
+
+        msg = buildMsg(bc)
+        last = bc_st["last_msg"]
+        # No need to publish it if nothing changed since the last one
+        if msg == last:
+            continue
+        bc_st["last_msg"] = msg
+
+        # Collect it for the combined message if enabled
+        if TELEMETRY_COMBINED:
+            combined[bc.name] = msg
+        else:
+            _queueBCMsg(bc_st, msg, last)
+
+    if combined:
+        queueMsq(all_topic, json.dumps(combined, separators=_JSON_SEP))
+
+
+def _emitLogs(log_topics: dict):
+    """
+    Queues all pending `telemetry_logs` entries for publishing.
+
+    Args:
+        log_topics: Log topic IDs per log level string. New log level topics
+            are registered and added on first use.
+    """
+    while telemetry_logs:
+        # Remove the earliest log entry
+        lvl, msg = telemetry_logs.popleft()
+
+        topic_id = log_topics.get(lvl)
+        if topic_id is None:
+            topic_id = queueMsq(f"{net_conf.MQTT_LOG_TOPIC}/{lvl}", None)
+            log_topics[lvl] = topic_id
+        queueMsq(topic_id, msg)
+
+
 async def broadcast(bcs: list[BatteryController,]):
     """
     Monitors each `BatteryController` in the ``bcs`` list and broadcasts MQTT
@@ -530,76 +827,106 @@ async def broadcast(bcs: list[BatteryController,]):
 
     with the message just a raw string, which may contain exception details.
 
+    Instead of continuously polling, we wait for `telemetry_event` to be set
+    on any state changes or triggers. The wait times out at the earliest
+    periodic emit deadline of any charging or discharging BC, so progress is
+    emitted on time without drift (see `_nextEmit`), after `_POLL_ACTIVE_MS`
+    if any BC is in the battery ID state (for battery voltage changes), or
+    `_POLL_IDLE_MS` otherwise.
+
+    BC telemetry is only published if the message differs from the last
+    message published for that BC. Subscribers can thus expect every message
+    to be a full snapshot of the BC state, but may not see periodic duplicates.
+
+    If `config.TELEMETRY_DELTA_FULL` is set, messages where the BC state did
+    not change only contain the changed values, and are published on the
+    ``delta`` sub topic of the BC topic::
+
+        topic = f"{net_conf.MQTT_PUB_TOPIC}/{bc.name}/delta"
+
+    A full message is still published on the normal topic for every state
+    change, if any value was removed from the message, after
+    `config.TELEMETRY_DELTA_FULL` delta messages, or after any queued message
+    was dropped or the MQTT connection was reestablished (see `_MQ_STATE`).
+
+    If `config.TELEMETRY_COMBINED` is set, the full messages for all BCs
+    emitted in the same pass are instead published as one message keyed on BC
+    name on this topic::
+
+        topic = f"{net_conf.MQTT_PUB_TOPIC}/all"
     """
 
     # We need access to some protected members of the BatteryController class,
     # so @pylint: disable=protected-access
 
-    # Keeps some state for each of the BCs
+    # Keeps some state for each of the BCs. This is keyed on the BC instance
+    # itself, which hashes on identity, so no name property call and string
+    # hash is needed for every lookup.
     state = {
-        bc.name: {
+        bc: {
             "state": None,
             "bat_v": None,
             "next_emit": time.ticks_add(time.ticks_ms(), TELEMETRY_EMIT_FREQ),
+            # The last message dict published for this BC
+            "last_msg": None,
+            # Register the publish topic for this BC once and keep the
+            # topic_id so we do not need to build and look up the topic
+            # string for every message.
+            "topic": queueMsq(f"{net_conf.MQTT_PUB_TOPIC}/{bc.name}", None),
+            # The same for the delta topic, and the number of deltas since the
+            # last full message, if delta messages are enabled.
+            "delta_topic": (
+                queueMsq(f"{net_conf.MQTT_PUB_TOPIC}/{bc.name}/delta", None)
+                if TELEMETRY_DELTA_FULL
+                else None
+            ),
+            "deltas": 0,
         }
         for bc in bcs
     }
+    # Topic for combined messages if enabled
+    all_topic = (
+        queueMsq(f"{net_conf.MQTT_PUB_TOPIC}/all", None) if TELEMETRY_COMBINED else None
+    )
+    # Log topic IDs per log level string, registered on first use
+    log_topics = {}
+    # To detect dropped messages or reconnects. See _MQ_STATE
+    resyncs = _MQ_STATE["resyncs"]
+
+    # Local references for anything used for every BC on every pass
+    ticks_ms = time.ticks_ms
+    trigger = telemetry_trigger.append
 
     while True:
-        # We sleep a short time here to be fairly responsive to changes to be
-        # emitted
-        await asyncio.sleep_ms(50)
+        # Wait for a state change or trigger event, or until it is time to
+        # check again for periodic emits or battery voltage changes.
+        try:
+            await asyncio.wait_for_ms(telemetry_event.wait(), _waitInterval(bcs, state))
+        except asyncio.TimeoutError:
+            pass
+        # Clear it before we check so we do not miss any events set while we
+        # process the current changes.
+        telemetry_event.clear()
+
+        # If a queued message was dropped, or we reconnected, subscribers may
+        # have missed a message that a later delta would build on. Forgetting
+        # the last messages makes the next message for every BC a full one.
+        if _MQ_STATE["resyncs"] != resyncs:
+            resyncs = _MQ_STATE["resyncs"]
+            for bc_st in state.values():
+                bc_st["last_msg"] = None
+                bc_st["deltas"] = 0
 
         # Check if we have any BCs that needs telemetry emitted
+        now = ticks_ms()
         for bc in bcs:
             # If this bc was already added as a trigger from an external
             # process, we skip any further checks - it will get an emit run
-            if bc in telemetry_trigger:
-                continue
-
-            # There are a number of conditions that can cause telemetry data to
-            # be emitted. This is n if statement with all these conditions. If
-            # any one of them are true for this BC, we mark the BC for
-            # telemetry emission.
-            if (
-                # Anytime a status changes - compared with our saved state
-                (state[bc.name]["state"] != bc.state)
-                # When in S_BAT_ID state (after dis/charge) the battery voltage
-                # takes time to stabilize. We keep record of the voltage in the
-                # BC state structure and then check for changes.
-                or (bc.state == bc.S_BAT_ID and bc.bat_v != state[bc.name]["bat_v"])
-                # When in one of the continues emit states (dis/charging), and emit time is reached
-                or (
-                    bc.state in [bc.S_CHARGE, bc.S_DISCHARGE]
-                    and time.ticks_diff(time.ticks_ms(), state[bc.name]["next_emit"])
-                    > 0
-                )
-            ):
-                telemetry_trigger.append(bc)
+            if bc not in telemetry_trigger and _needsEmit(bc, state[bc], now):
+                trigger(bc)
 
         # Now emit any telemetry for any BC that are ready
-        for _ in range(len(telemetry_trigger)):
-            # Remove it from the trigger list
-            bc = telemetry_trigger.pop(0)
-
-            # State updates:
-            # Set it's next emit time
-            state[bc.name]["next_emit"] = time.ticks_add(
-                time.ticks_ms(), TELEMETRY_EMIT_FREQ
-            )
-            # Update the state
-            state[bc.name]["state"] = bc.state
-            # And the battery voltage
-            state[bc.name]["bat_v"] = bc.bat_v
-
-            msg = buildMsg(bc)
-            topic = f"{net_conf.MQTT_PUB_TOPIC}/{bc.name}"
-            queueMsq(topic, json.dumps(msg))
+        _emitTriggered(state, now, all_topic)
 
         # And also emit any logs
-        while telemetry_logs:
-            # Remove the earliest log entry
-            lvl, msg = telemetry_logs.pop(0)
-
-            topic = f"{net_conf.MQTT_LOG_TOPIC}/{lvl}"
-            queueMsq(topic, msg)
+        _emitLogs(log_topics)